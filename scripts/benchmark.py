@@ -0,0 +1,256 @@
+# 저장된 HTML 픽스처로 사이트별 추출 성능 측정 (네트워크 사용 안 함)
+# fixtures/<사이트>/listing.html(목록)과 detail.html(상세)을 크롤러와 같은 추출 코드로 반복 처리하고
+# 단계별 시간, 초당 페이지/이벤트 수, 최대 메모리를 JSON 파일(기본값: .cache/)로 저장합니다.
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+from detail_pages import parse_detail
+from exporter import EventShardWriter, file_digest, write_events
+from extractors import extract_page, extract_record, parse_scope
+from improved_crawler_v2 import ImprovedMovieEventCrawler
+from indexes import FacetIndexBuilder, SearchIndexBuilder
+from page_parser import DEFAULT_PARSER, PARSERS, parse_html
+from selector_engine import select_fallback
+from sites import parse_sites, site_names
+from structured_data import extract_structured_events
+from title_filter import clean_title, is_movie_related
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+# 단계 순서 - 결과 표와 JSON에 이 순서로 기록
+STAGES = ('structured', 'parse', 'select', 'extract', 'title_filter', 'detail', 'export')
+
+
+def load_fixture(site, name):
+    with open(os.path.join(FIXTURE_DIR, site, name), 'rb') as f:
+        return f.read()
+
+
+def available_sites():
+    """listing.html 픽스처가 있는 사이트"""
+    return [site for site in site_names()
+            if os.path.exists(os.path.join(FIXTURE_DIR, site, 'listing.html'))]
+
+
+def _timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def _export(events, directory):
+    """크롤러의 save_events와 같은 출력 (JSON/CSV + 패싯/검색 인덱스 + 페이지 파일)"""
+    facets = FacetIndexBuilder()
+    search_index = SearchIndexBuilder()
+    shards = EventShardWriter(directory)
+    write_events(events, os.path.join(directory, 'events.json'), os.path.join(directory, 'events.csv'),
+                 observers=[facets, search_index, shards])
+    generation = file_digest(os.path.join(directory, 'events.json'))
+    facets.write(os.path.join(directory, 'events-facets.json'), generation)
+    search_index.write(os.path.join(directory, 'events-search.json'), generation)
+    shards.write()
+
+
+class SiteBenchmark:
+    """사이트 하나의 목록/상세 픽스처를 단계별로 나눠 반복 측정"""
+
+    def __init__(self, site, crawler, parser=None, scoped=True):
+        self.site = site
+        self.crawler = crawler
+        self.parser = parser
+        self.scoped = scoped
+        self.adapter = crawler.adapters[site]
+        self.selectors = self.adapter.container_selectors
+        self.listing = load_fixture(site, 'listing.html')
+        detail_path = os.path.join(FIXTURE_DIR, site, 'detail.html')
+        self.detail = load_fixture(site, 'detail.html') if os.path.exists(detail_path) else None
+
+    def extract(self):
+        """크롤러와 같은 목록 페이지 추출 - 픽스처 전체를 보도록 개수 제한 없음"""
+        return extract_page(self.site, self.listing, self.selectors, self.adapter.fields, self.adapter.base_url, None,
+                            parser=self.parser, scoped=self.scoped)
+
+    def run_stages(self, export_dir):
+        """한 번 실행한 단계별 시간(초) - 구조화 데이터가 있는 페이지도 DOM 단계까지 모두 측정"""
+        timings = {}
+        _, timings['structured'] = _timed(extract_structured_events, self.listing, self.adapter.base_url)
+
+        scope = parse_scope(self.selectors, self.adapter.fields) if self.scoped else None
+        soup, timings['parse'] = _timed(parse_html, self.listing, scope=scope, parser=self.parser)
+        elements, timings['select'] = _timed(select_fallback, soup, self.selectors)
+
+        start = time.perf_counter()
+        titles = [element.get_text(strip=True) for element in elements]
+        for element in elements:
+            try:
+                extract_record(element, self.adapter.base_url, self.adapter.fields)
+            except Exception:
+                continue
+        timings['extract'] = time.perf_counter() - start
+        soup.decompose()
+
+        # 제목 필터는 캐시를 비우고 측정 (실제 크롤링에서 처음 보는 제목)
+        clean_title.cache_clear()
+        is_movie_related.cache_clear()
+        start = time.perf_counter()
+        for title in titles:
+            cleaned = clean_title(title)
+            if cleaned:
+                is_movie_related(cleaned)
+        timings['title_filter'] = time.perf_counter() - start
+
+        timings['detail'] = _timed(parse_detail, self.detail, self.adapter.base_url)[1] if self.detail else 0.0
+
+        events = self.build_events()
+        timings['export'] = _timed(_export, events, export_dir)[1]
+        return timings
+
+    def build_events(self):
+        """크롤러와 같은 이벤트 생성과 중복 제거 - 중복 제거 후 남은 이벤트 목록"""
+        result = self.extract()
+        self.crawler.events = []
+        self.crawler.event_ids = set()
+        self.crawler._page_events = []
+        for record in result['records'] or []:
+            self.crawler.add_event(self.crawler.build_event(self.site, record))
+        return self.crawler.events
+
+    def peak_memory(self, export_dir):
+        """목록 추출 + 상세 파싱 + 저장 한 번의 최대 메모리 할당량(MB) - 시간 측정과 따로 실행"""
+        tracemalloc.start()
+        try:
+            self.extract()
+            if self.detail:
+                parse_detail(self.detail, self.adapter.base_url)
+            _export(self.build_events(), export_dir)
+            return tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+        finally:
+            tracemalloc.stop()
+
+    def run(self, iterations, warmup=1):
+        with tempfile.TemporaryDirectory() as export_dir:
+            for _ in range(warmup):
+                self.run_stages(export_dir)
+                self.extract()
+
+            stage_runs = {stage: [] for stage in STAGES}
+            for _ in range(iterations):
+                for stage, seconds in self.run_stages(export_dir).items():
+                    stage_runs[stage].append(seconds)
+
+            # 페이지 단위 처리량 - 크롤러가 실제로 호출하는 extract_page 전체 시간
+            clean_title.cache_clear()
+            is_movie_related.cache_clear()
+            page_runs = []
+            for _ in range(iterations):
+                result, seconds = _timed(self.extract)
+                page_runs.append(seconds)
+            page_seconds = statistics.median(page_runs)
+            records = len(result['records'] or [])
+            # 같은 ID로 합쳐지는 레코드가 있으면 추출 개수보다 적음
+            events = len(self.build_events())
+
+            peak_mb = self.peak_memory(export_dir)
+
+        return {
+            'listing_bytes': len(self.listing),
+            'detail_bytes': len(self.detail) if self.detail else 0,
+            'structured': result['structured'],
+            'elements': result['count'],
+            'records': records,
+            'events': events,
+            'page_ms': page_seconds * 1000,
+            'pages_per_sec': 1 / page_seconds if page_seconds else None,
+            'events_per_sec': events / page_seconds if page_seconds else None,
+            'stages_ms': {stage: statistics.median(runs) * 1000 for stage, runs in stage_runs.items()},
+            'stages_min_ms': {stage: min(runs) * 1000 for stage, runs in stage_runs.items()},
+            'peak_memory_mb': peak_mb
+        }
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(sites, iterations=20, parser=None, scoped=True):
+    # 저장 단계의 임의 기본값(유형/장르 등)을 실행마다 같게 유지
+    random.seed(0)
+    crawler = ImprovedMovieEventCrawler(concurrent=False, details=False, sites=sites)
+    results = {}
+    for site in sites:
+        results[site] = SiteBenchmark(site, crawler, parser=parser, scoped=scoped).run(iterations)
+    crawler.http.close()
+    return {
+        'created_at': datetime.now().isoformat(),
+        'git_revision': git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'parser': parser or DEFAULT_PARSER,
+        'scoped': scoped,
+        'iterations': iterations,
+        'sites': results
+    }
+
+
+def _change(current, previous):
+    if not previous:
+        return ""
+    return f" ({(current - previous) / previous * 100:+.1f}%)"
+
+
+def print_report(report, previous=None):
+    previous_sites = previous.get('sites', {}) if previous else {}
+    print(f"파서: {report['parser']}, 반복: {report['iterations']}회, 리비전: {report['git_revision'] or '-'}")
+    for site, result in report['sites'].items():
+        before = previous_sites.get(site, {})
+        kind = "구조화 데이터" if result['structured'] else "DOM"
+        print(f"\n[{site}] {result['listing_bytes'] // 1024}KB, 요소 {result['elements']}개 -> "
+              f"레코드 {result['records']}개 -> 중복 제거 후 이벤트 {result['events']}개 ({kind})")
+        print(f"  페이지 처리: {result['page_ms']:.2f}ms{_change(result['page_ms'], before.get('page_ms'))}, "
+              f"{result['pages_per_sec']:.1f} 페이지/초, {result['events_per_sec']:.0f} 이벤트/초")
+        for stage in STAGES:
+            ms = result['stages_ms'][stage]
+            print(f"  {stage:<13} {ms:8.3f}ms{_change(ms, before.get('stages_ms', {}).get(stage))}")
+        print(f"  최대 메모리: {result['peak_memory_mb']:.2f}MB"
+              f"{_change(result['peak_memory_mb'], before.get('peak_memory_mb'))}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="저장된 HTML 픽스처로 추출 성능 측정")
+    parser.add_argument('--sites', help="측정할 사이트 (쉼표로 구분, 기본값: 픽스처가 있는 모든 사이트)")
+    parser.add_argument('--iterations', type=int, default=20, help="단계별 반복 횟수 (중앙값 사용)")
+    parser.add_argument('--parser', choices=PARSERS, help="HTML 파서 백엔드 (기본값: lxml, 없으면 html.parser)")
+    parser.add_argument('--full-parse', action='store_true', help="범위 파싱 대신 문서 전체를 파싱")
+    parser.add_argument('--output', default='.cache/benchmark-results.json', help="결과를 저장할 JSON 파일")
+    parser.add_argument('--compare', help="비교할 이전 결과 JSON 파일")
+    args = parser.parse_args()
+
+    try:
+        sites = parse_sites(args.sites) if args.sites else available_sites()
+    except ValueError as e:
+        parser.error(str(e))
+    report = run_benchmarks(sites, iterations=args.iterations, parser=args.parser, scoped=not args.full_parse)
+
+    previous = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            previous = json.load(f)
+    print_report(report, previous)
+
+    os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n결과를 {args.output}에 저장했습니다.")
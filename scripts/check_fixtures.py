@@ -0,0 +1,41 @@
+# 저장된 상세 페이지 픽스처로 기간/장소 추출 결과 확인 (네트워크 사용 안 함)
+# fixtures/<사이트>/detail.html을 크롤러와 같은 parse_detail로 처리하고 기대값과 다르면 종료 코드 1을 돌려줍니다.
+# 픽스처나 추출 규칙을 바꾸면 함께 실행하고, 의도한 변경이면 EXPECTED_DETAILS를 갱신합니다.
+import os
+import sys
+
+from detail_pages import parse_detail
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+# 사이트별 상세 페이지 기대값 - (기준 URL, parse_detail 결과)
+EXPECTED_DETAILS = {
+    'cgv': ("https://www.cgv.co.kr",
+            {'date': '2025-07-04', 'end_date': '2025-07-11', 'location': 'CGV 용산아이파크몰'}),
+    'megabox': ("https://www.megabox.co.kr",
+                {'date': '2025-09-06', 'end_date': '2025-09-13', 'location': '메가박스 용산아이파크몰'}),
+    # JSON-LD의 startDate/endDate/location이 본문보다 우선
+    'maxmovie': ("https://www.maxmovie.com",
+                 {'date': '2025-07-08', 'end_date': '2025-07-15', 'location': '맥스무비 온라인'}),
+    'lotte': ("https://www.lottecinema.co.kr",
+              {'date': '2025-07-10', 'end_date': '2025-07-17', 'location': '롯데시네마 용산아이파크몰'})
+}
+
+
+def check_details():
+    """기대값과 다른 사이트의 (사이트, 기대값, 실제값) 목록"""
+    failures = []
+    for site, (base_url, expected) in EXPECTED_DETAILS.items():
+        with open(os.path.join(FIXTURE_DIR, site, 'detail.html'), 'rb') as f:
+            actual = parse_detail(f.read(), base_url)
+        if actual != expected:
+            failures.append((site, expected, actual))
+    return failures
+
+
+if __name__ == "__main__":
+    failures = check_details()
+    for site, expected, actual in failures:
+        print(f"{site}: 기대값 {expected}, 실제값 {actual}")
+    print(f"상세 페이지 픽스처 {len(EXPECTED_DETAILS) - len(failures)}/{len(EXPECTED_DETAILS)}개 통과")
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,78 @@
+import os
+from datetime import date
+
+from exporter import EVENT_FIELDS
+
+# pyarrow는 이력 저장을 켰을 때 처음 불러옴 (크롤러 시작 시간에 포함되지 않게 함)
+pa = None
+pq = None
+
+# 지원하는 컬럼 포맷 - parquet 또는 Arrow IPC(feather v2)
+COLUMNAR_FORMATS = ('parquet', 'arrow')
+
+# 값 종류가 적고 반복이 많아 사전 인코딩(dictionary encoding)하는 컬럼
+DICTIONARY_FIELDS = ('source', 'type', 'genre', 'location')
+
+
+def columnar_available():
+    """pyarrow 사용 가능 여부 - 처음 호출할 때 import"""
+    global pa, pq
+    if pa is None:
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            return False
+        pa, pq = pyarrow, pyarrow.parquet
+    return True
+
+
+class ColumnarHistoryWriter:
+    """크롤링 결과를 크롤링 날짜별 파티션의 컬럼 파일로 저장 (분석용 이력)
+
+    history/crawl_date=YYYY-MM-DD/events.parquet 형태의 Hive 파티션 구조라서
+    pyarrow.dataset이나 DuckDB로 여러 달치 이력을 필요한 컬럼만 읽어 조회할 수 있습니다.
+    같은 날 다시 실행하면 그날 파티션만 교체합니다. write_events의 observer로 사용합니다.
+    pyarrow가 없으면 사용할 수 없습니다 (pip install pyarrow).
+    """
+
+    def __init__(self, directory='data/history', format='parquet', crawl_date=None):
+        if not columnar_available():
+            raise RuntimeError("컬럼 포맷 저장에는 pyarrow가 필요합니다 (pip install pyarrow)")
+        if format not in COLUMNAR_FORMATS:
+            raise ValueError(f"지원하지 않는 포맷: {format}")
+        self.directory = directory
+        self.format = format
+        self.crawl_date = crawl_date or date.today().isoformat()
+        self.columns = {field: [] for field in EVENT_FIELDS}
+
+    def add(self, event):
+        for field, values in self.columns.items():
+            values.append(event.get(field))
+
+    def build(self):
+        """이벤트 필드를 문자열 컬럼으로 모은 Arrow 테이블"""
+        arrays = []
+        for field, values in self.columns.items():
+            array = pa.array(values, type=pa.string())
+            arrays.append(array.dictionary_encode() if field in DICTIONARY_FIELDS else array)
+        return pa.Table.from_arrays(arrays, names=list(self.columns))
+
+    def write(self):
+        """오늘 파티션 파일을 쓰고 경로를 반환"""
+        partition = os.path.join(self.directory, f"crawl_date={self.crawl_date}")
+        os.makedirs(partition, exist_ok=True)
+        extension = 'parquet' if self.format == 'parquet' else 'arrow'
+        path = os.path.join(partition, f"events.{extension}")
+        tmp_path = path + '.tmp'
+
+        table = self.build()
+        if self.format == 'parquet':
+            pq.write_table(table, tmp_path, compression='zstd', use_dictionary=list(DICTIONARY_FIELDS))
+        else:
+            with pa.OSFile(tmp_path, 'wb') as sink:
+                with pa.ipc.new_file(sink, table.schema,
+                                     options=pa.ipc.IpcWriteOptions(compression='zstd')) as writer:
+                    writer.write_table(table)
+        os.replace(tmp_path, path)
+        return path
@@ -0,0 +1,87 @@
+import hashlib
+import json
+import os
+
+# 이벤트 내용 지문에 사용하는 필드 - 사이트에서 실제로 추출한 값만 포함
+CONTENT_FIELDS = ('title', 'description', 'image', 'link', 'source')
+
+
+def _digest(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def fingerprint_elements(elements):
+    """이벤트 컨테이너 요소들의 지문 - HTML이 한 글자라도 바뀌면 달라짐"""
+    return _digest('\n'.join(str(element) for element in elements))
+
+
+def fingerprint_event(event):
+    """이벤트 내용 지문"""
+    return _digest(json.dumps([event.get(field) for field in CONTENT_FIELDS], ensure_ascii=False))
+
+
+class CrawlState:
+    """증분 크롤링 상태 저장소
+
+    페이지별 이벤트 컨테이너 지문과 추출 결과, 이벤트 ID별 내용 지문, 상세 페이지 추출 결과를 JSON 파일로
+    보관합니다. 컨테이너 지문이 지난번과 같으면 추출을 건너뛰고 저장된 결과를 그대로 사용합니다.
+    """
+
+    def __init__(self, path='.cache/crawl_state.json'):
+        self.path = path
+        self.pages = {}
+        self.events = {}
+        self.details = {}
+        try:
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+            self.pages = data.get('pages', {})
+            self.events = data.get('events', {})
+            self.details = data.get('details', {})
+        except (OSError, ValueError):
+            pass
+
+    def page_unchanged(self, url, fingerprint):
+        page = self.pages.get(url)
+        return page is not None and page['fingerprint'] == fingerprint
+
+    def page_events(self, url):
+        """저장된 페이지 추출 결과 (없으면 None)"""
+        page = self.pages.get(url)
+        return page['events'] if page else None
+
+    def set_page(self, url, fingerprint, events):
+        self.pages[url] = {'fingerprint': fingerprint, 'events': events}
+
+    def event_unchanged(self, event):
+        return self.events.get(event['id']) == fingerprint_event(event)
+
+    def set_event(self, event):
+        self.events[event['id']] = fingerprint_event(event)
+
+    def forget_event(self, event_id):
+        self.events.pop(event_id, None)
+
+    def detail(self, link):
+        """저장된 상세 페이지 추출 결과 (없으면 None)"""
+        return self.details.get(link)
+
+    def set_detail(self, link, detail):
+        self.details[link] = detail
+
+    def prune(self, keep_page, keep_detail):
+        """이번 실행에서 보지 않은 URL의 페이지/상세 페이지 항목 삭제 - keep_*(url)이 False인 항목을 지움
+
+        지우지 않으면 한 번이라도 본 URL이 모두 남아 상태 파일이 실행마다 커집니다.
+        """
+        self.pages = {url: page for url, page in self.pages.items() if keep_page(url)}
+        self.details = {link: detail for link, detail in self.details.items() if keep_detail(link)}
+
+    def save(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'pages': self.pages, 'events': self.events, 'details': self.details}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
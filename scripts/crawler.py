@@ -1,18 +1,20 @@
-import requests
 from bs4 import BeautifulSoup
-import json
-import pandas as pd
 from datetime import datetime, timedelta
 import time
 import random
 import os
 
+from exporter import write_events
+from http_client import HttpClient
+from rate_limiter import HostRateLimiter
+
 class MovieEventCrawler:
     def __init__(self):
         self.events = []
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
+        self.http = HttpClient(headers=self.headers, rate_limiter=HostRateLimiter())
     
     def crawl_cgv_events(self):
         """CGV 이벤트 크롤링"""
@@ -23,7 +25,7 @@ class MovieEventCrawler:
             url = "http://www.cgv.co.kr/culture-event/event/"
             
             try:
-                response = requests.get(url, headers=self.headers, timeout=10)
+                response = self.http.get(url)
                 response.raise_for_status()
                 soup = BeautifulSoup(response.content, 'html.parser')
                 
@@ -132,7 +134,7 @@ class MovieEventCrawler:
             url = "https://www.megabox.co.kr/event/curtaincall"
             
             try:
-                response = requests.get(url, headers=self.headers, timeout=10)
+                response = self.http.get(url)
                 response.raise_for_status()
                 soup = BeautifulSoup(response.content, 'html.parser')
                 
@@ -191,7 +193,7 @@ class MovieEventCrawler:
             url = "https://www.maxmovie.com/event"
             
             try:
-                response = requests.get(url, headers=self.headers, timeout=10)
+                response = self.http.get(url)
                 response.raise_for_status()
                 soup = BeautifulSoup(response.content, 'html.parser')
                 
@@ -298,13 +300,9 @@ class MovieEventCrawler:
             # public/data 디렉토리가 없으면 생성
             os.makedirs('public/data', exist_ok=True)
             
-            with open('public/data/events.json', 'w', encoding='utf-8') as f:
-                json.dump(self.events, f, ensure_ascii=False, indent=2)
-            print(f"총 {len(self.events)}개 이벤트를 events.json에 저장했습니다.")
-            
-            # CSV 파일로도 저장 (분석용)
-            df = pd.DataFrame(self.events)
-            df.to_csv('public/data/events.csv', index=False, encoding='utf-8-sig')
+            # JSON과 CSV(분석용)를 한 번에 스트리밍으로 쓰고 임시 파일 rename으로 교체
+            count = write_events(self.events, 'public/data/events.json', 'public/data/events.csv')
+            print(f"총 {count}개 이벤트를 events.json에 저장했습니다.")
             print("이벤트 데이터를 CSV 파일로도 저장했습니다.")
             
         except Exception as e:
@@ -0,0 +1,138 @@
+import re
+from collections import namedtuple
+from datetime import date, timedelta
+from functools import lru_cache
+
+# 정규화 결과 - start/end는 YYYY-MM-DD 문자열 또는 None, ongoing은 '상시' 이벤트 여부
+DateRange = namedtuple('DateRange', ['start', 'end', 'ongoing'], defaults=(None, None, False))
+
+EMPTY = DateRange()
+
+# 날짜 조각
+_YMD = r'\d{4}\s*(?:[-./]|년)\s*\d{1,2}\s*(?:[-./]|월)\s*\d{1,2}(?:\s*일)?'
+# 두 자리 연도 (25.07.01) - 연/월/일 모두 두 자리인 점 형식만 허용
+_YY = r'\d{2}\s*\.\s*\d{2}\s*\.\s*\d{2}'
+# 연도가 있는 날짜
+_FULL = rf'(?:{_YMD}|{_YY})'
+# 연도 없는 날짜 - 소수(4.5)와 구분하려고 점 형식은 두 자리만 허용
+_MD = r'(?:\d{2}\s*\.\s*\d{2}|\d{1,2}\s*/\s*\d{1,2}|\d{1,2}\s*월\s*\d{1,2}\s*일)'
+# 기간 끝 - 앞에 완전한 날짜와 구분 기호가 있으므로 한 자리 월의 점 형식(7.15)도 허용
+_MD_END = rf'(?:\d{{1,2}}\s*\.\s*\d{{1,2}}|{_MD})'
+# 일만 있는 기간 끝 - 뒤에 시각(14:00)이나 월.일(7.15)이 이어지면 제외
+_D = r'\d{1,2}(?:\s*일)?(?!\s*:|\s*[./]\s*\d)'
+_COMPACT = r'(?:19|20)\d{6}'
+# 날짜 뒤의 마침표, 요일, 시각 - 2025.07.01.(화) 14:00
+_TAIL = r'\.?(?:\s*\([^)]{1,3}\))?(?:\s*\d{1,2}:\d{2})?'
+_RANGE = r'\s*(?:~|∼|〜|부터|–|-)\s*'
+
+_DIGITS_RE = re.compile(r'\d+')
+
+
+def _pattern(regex):
+    return re.compile(r'(?<!\d)' + regex + r'(?!\d)')
+
+
+# (형식, 패턴) - 실제 페이지에서 자주 나오는 순서. 앞의 패턴이 맞으면 뒤는 보지 않음
+PATTERNS = [
+    ('range', _pattern(rf'(?P<start>{_FULL}){_TAIL}{_RANGE}(?P<end>{_FULL}){_TAIL}')),
+    ('range', _pattern(rf'(?P<start>{_FULL}){_TAIL}{_RANGE}(?P<end>{_MD_END}){_TAIL}')),
+    ('range', _pattern(rf'(?P<start>{_FULL}){_TAIL}{_RANGE}(?P<end>{_D})')),
+    # 연도가 있는 종료일만 있는 기간(~2025.07.31, 2025.07.31까지)은 시작일로 읽지 않도록 단일 날짜보다 먼저 확인
+    ('until', re.compile(rf'(?:^|(?<=\s))[~∼〜]\s*(?P<end>{_FULL})(?!\d)')),
+    ('until', _pattern(rf'(?P<end>{_FULL}){_TAIL}\s*까지')),
+    # 두 자리 연도는 월.일(25.07)로 읽히지 않도록 연도 없는 날짜보다 먼저 확인
+    ('single', _pattern(rf'(?P<start>{_FULL}){_TAIL}')),
+    ('range', _pattern(rf'(?P<start>{_MD}){_TAIL}{_RANGE}(?P<end>{_MD_END}){_TAIL}')),
+    ('range', _pattern(rf'(?P<start>{_MD}){_TAIL}{_RANGE}(?P<end>{_D})')),
+    ('until', re.compile(rf'(?:^|(?<=\s))[~∼〜]\s*(?P<end>{_YMD}|{_MD})')),
+    ('until', _pattern(rf'(?P<end>{_YMD}|{_MD}){_TAIL}\s*까지')),
+    ('single', _pattern(rf'(?P<start>{_MD}){_TAIL}')),
+    ('single', _pattern(rf'(?P<start>{_COMPACT})')),
+    ('ongoing', re.compile(r'상시')),
+]
+
+# 연도가 없는 날짜가 기준일보다 이만큼 이전이면 다음 해로 봄 (12월에 보는 01.10 등)
+_YEAR_ROLLOVER = timedelta(days=180)
+
+
+def _parts(token):
+    """날짜 조각의 (연, 월, 일) - 없는 부분은 None"""
+    if re.fullmatch(_COMPACT, token):
+        return int(token[:4]), int(token[4:6]), int(token[6:])
+    numbers = [int(n) for n in _DIGITS_RE.findall(token)]
+    # 두 자리 연도는 2000년대
+    if len(numbers) == 3 and numbers[0] < 100:
+        numbers[0] += 2000
+    return tuple([None] * (3 - len(numbers)) + numbers)
+
+
+def _make_date(year, month, day):
+    try:
+        return date(year, month, day)
+    except (TypeError, ValueError):
+        return None
+
+
+def _resolve(token, reference, base=None):
+    """날짜 조각을 date로 - 연/월이 없으면 base(기간 시작일)나 기준일에서 가져옴"""
+    year, month, day = _parts(token)
+    if year is not None:
+        return _make_date(year, month, day)
+    if base is not None:
+        resolved = _make_date(base.year, month or base.month, day)
+        # 연말을 넘어가는 기간 (2025.12.20 ~ 01.10)
+        if resolved and resolved < base:
+            resolved = _make_date(base.year + 1, resolved.month, resolved.day)
+        return resolved
+    resolved = _make_date(reference.year, month, day)
+    if resolved and resolved < reference - _YEAR_ROLLOVER:
+        resolved = _make_date(reference.year + 1, month, day)
+    return resolved
+
+
+def _iso(value):
+    return value.isoformat() if value else None
+
+
+@lru_cache(maxsize=8192)
+def _parse(text, reference):
+    reference = date.fromisoformat(reference)
+    for kind, pattern in PATTERNS:
+        for match in pattern.finditer(text):
+            if kind == 'ongoing':
+                return DateRange(ongoing=True)
+            if kind == 'until':
+                end = _resolve(match.group('end'), reference)
+                if end:
+                    return DateRange(end=_iso(end))
+                continue
+            start = _resolve(match.group('start'), reference)
+            # 날짜 형식이지만 실제 날짜가 아니면 (2025.13.45 등) 다음 후보
+            if not start:
+                continue
+            end = _resolve(match.group('end'), reference, base=start) if kind == 'range' else None
+            return DateRange(_iso(start), _iso(end) if end and end != start else None)
+    return EMPTY
+
+
+def parse_date_range(text, reference=None):
+    """날짜/기간 문자열을 DateRange로 정규화 - 날짜가 없으면 EMPTY
+
+    '2025.07.01 ~ 2025.07.15', '25.07.01', '07.01(화)', '~7/15', '2025년 7월 1일', '상시' 같은 형식을 처리합니다.
+    연도가 없으면 reference(기본값: 오늘) 기준으로 가까운 연도를 사용합니다.
+    결과는 원문 문자열 단위로 캐시됩니다.
+    """
+    if not text:
+        return EMPTY
+    reference = reference or date.today()
+    return _parse(text.strip(), reference.isoformat())
+
+
+def parse_date_ranges(texts, reference=None):
+    """여러 문자열을 한 번에 정규화 - 같은 문자열은 한 번만 파싱"""
+    reference = reference or date.today()
+    results = {}
+    for text in texts:
+        if text not in results:
+            results[text] = parse_date_range(text, reference)
+    return [results[text] for text in texts]
@@ -1,7 +1,8 @@
-import requests
 from bs4 import BeautifulSoup
 import json
 
+from http_client import HttpClient
+
 def debug_site_structure():
     headers = {
         'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
@@ -26,13 +27,16 @@ def debug_site_structure():
         }
     ]
     
+    # 같은 세션을 재사용해서 사이트 간 커넥션을 공유
+    client = HttpClient(headers=headers)
+    
     for site in sites:
         print(f"\n{'='*50}")
         print(f"{site['name']} 분석")
         print(f"{'='*50}")
         
         try:
-            response = requests.get(site['url'], headers=headers, timeout=10)
+            response = client.get(site['url'])
             response.raise_for_status()
             soup = BeautifulSoup(response.content, 'html.parser')
             
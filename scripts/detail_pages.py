@@ -0,0 +1,110 @@
+import html
+import re
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from date_parser import parse_date_range, parse_date_ranges
+from structured_data import extract_structured_events
+
+# 본문 텍스트 추출용 - 스크립트/스타일 제거, 블록 태그는 줄바꿈으로
+_SKIP_BLOCK_RE = re.compile(r'<(script|style|noscript)\b.*?</\1\s*>', re.S | re.I)
+_BLOCK_TAG_RE = re.compile(r'<(?:br|/p|/div|/li|/tr|/dt|/dd|/h\d)\b[^>]*>', re.I)
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# 기간/장소 항목 이름
+_PERIOD_LABEL_RE = re.compile(r'(?:이벤트|행사|응모|상영)?\s*(?:기간|일시|일정|날짜)')
+_VENUE_LABEL = r'(?:장소|극장|상영관|행사장|진행\s*극장|참여\s*극장)'
+# 줄 맨 앞의 항목 이름 뒤에 같은 줄로 이어지는 값 (메뉴의 '극장' 링크 다음 줄을 장소로 읽지 않음)
+_VENUE_RE = re.compile(rf'^{_VENUE_LABEL}(?:[ \t]*[:：][ \t]*|[ \t]+)([^\n|]{{2,40}})', re.M)
+# <dt>장소</dt><dd>값</dd>, <th>장소</th><td>값</td> 형태의 항목 - 값은 다음 칸에서 가져옴
+_VENUE_ROW_RE = re.compile(rf'<(dt|th)\b[^>]*>\s*{_VENUE_LABEL}\s*</\1\s*>\s*<(dd|td)\b[^>]*>(.*?)</\2\s*>',
+                           re.S | re.I)
+
+
+def page_text(content):
+    """상세 페이지 본문 텍스트 - 줄 단위 구조는 유지"""
+    text = content.decode('utf-8', errors='replace') if isinstance(content, bytes) else content
+    text = _SKIP_BLOCK_RE.sub(' ', text)
+    text = _BLOCK_TAG_RE.sub('\n', text)
+    text = html.unescape(_TAG_RE.sub(' ', text))
+    return '\n'.join(' '.join(line.split()) for line in text.splitlines() if line.strip())
+
+
+def parse_detail(content, base_url):
+    """상세 페이지에서 기간과 장소 추출 - {'date', 'end_date', 'location'} 중 찾은 값만 포함 (end_date는 date가 있을 때만)
+
+    페이지에 포함된 JSON을 먼저 보고, 없으면 '기간', '장소' 같은 항목 이름 근처의 텍스트를 사용합니다.
+    """
+    detail = {}
+    for record in extract_structured_events(content, base_url):
+        if record['date'] and 'date' not in detail:
+            detail['date'] = record['date']
+            if record['end_date']:
+                detail['end_date'] = record['end_date']
+        if record['location'] and 'location' not in detail:
+            detail['location'] = record['location']
+
+    text = page_text(content)
+    if 'date' not in detail:
+        # 항목 이름 뒤의 기간을 우선 사용하고, 없으면 본문의 첫 날짜
+        # ('상시' 기간이면 본문의 다른 날짜(당첨자 발표일 등)를 기간으로 읽지 않음)
+        label = _PERIOD_LABEL_RE.search(text)
+        period = _labelled_period(text[label.end():label.end() + 80]) if label else None
+        if not period or not (period.start or period.end or period.ongoing):
+            # 줄마다 따로 정규화 - 머리글/바닥글처럼 페이지마다 반복되는 줄은 캐시에서 바로 나옴
+            period = next((line_period for line_period in parse_date_ranges(text.splitlines())
+                           if line_period.start or line_period.end), None)
+        # 종료일은 시작일이 있을 때만 사용 - 시작일이 임의 기본값인 이벤트에 종료일만 붙지 않게 함
+        if period and period.start:
+            detail['date'] = period.start
+            if period.end:
+                detail['end_date'] = period.end
+    if 'location' not in detail:
+        detail_location = _find_venue(content, text)
+        if detail_location:
+            detail['location'] = detail_location
+    return detail
+
+
+def _labelled_period(rest):
+    """항목 이름 뒤의 기간 - 값이 있는 첫 줄(기간: 상시, <dt>기간</dt><dd>상시</dd>)을 먼저 보고, 없으면 뒤의 줄까지 봄"""
+    first = next((line for line in rest.split('\n') if line.strip(' :：')), '')
+    period = parse_date_range(first)
+    if period.start or period.end or period.ongoing:
+        return period
+    return parse_date_range(rest)
+
+
+def _find_venue(content, text):
+    """항목 이름이 붙은 장소 - 정의 목록/표의 항목을 먼저 보고, 없으면 '장소: 값' 형태의 줄"""
+    raw = content.decode('utf-8', errors='replace') if isinstance(content, bytes) else content
+    row = _VENUE_ROW_RE.search(raw)
+    if row:
+        venue = page_text(row.group(3)).replace('\n', ' ').strip(' :-·')
+        if len(venue) >= 2:
+            return venue
+    venue = _VENUE_RE.search(text)
+    return venue.group(1).strip(' :-·') if venue else None
+
+
+def stream_details(urls, fetch, max_workers=6, max_in_flight=None):
+    """상세 페이지를 제한된 동시성으로 받아 완료되는 순서대로 (url, 본문 또는 예외)를 반환
+
+    전체 목록을 한꺼번에 제출하지 않고 동시에 진행 중인 작업을 max_in_flight개로 유지하므로
+    이벤트 수가 늘어도 대기 중인 작업과 받아둔 본문이 메모리에 쌓이지 않습니다.
+    """
+    max_in_flight = max_in_flight or max_workers * 2
+    pending = iter(urls)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        in_flight = {}
+        for url in pending:
+            in_flight[executor.submit(fetch, url)] = url
+            if len(in_flight) >= max_in_flight:
+                break
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                url = in_flight.pop(future)
+                yield url, future.result()
+                next_url = next(pending, None)
+                if next_url is not None:
+                    in_flight[executor.submit(fetch, next_url)] = next_url
@@ -0,0 +1,43 @@
+import hashlib
+import re
+from urllib.parse import urlsplit
+
+# 내용 기반 ID의 끝부분 - 키 해시 12자리와 선택적인 순번
+_CONTENT_ID_RE = re.compile(r'_[0-9a-f]{12}(?:_\d+)?$')
+
+
+def normalize_text(value):
+    """공백을 하나로 합치고 소문자로 변환"""
+    return ' '.join((value or '').split()).lower()
+
+
+def normalize_link(link):
+    """링크 정규화 - http/https, 호스트 대소문자, 끝의 '/', fragment 차이는 무시"""
+    parts = urlsplit((link or '').strip())
+    path = parts.path.rstrip('/') or '/'
+    query = f"?{parts.query}" if parts.query else ''
+    return f"{parts.netloc.lower()}{path}{query}"
+
+
+def event_key(event):
+    """이벤트 식별 키 - 같은 출처의 같은 링크/제목이면 같은 이벤트"""
+    normalized = '\n'.join([
+        normalize_text(event['source']),
+        normalize_link(event['link']),
+        normalize_text(event['title'])
+    ])
+    return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+
+def make_event_id(prefix, source, link, title, occurrence=1):
+    """내용 기반 이벤트 ID - 크롤링 순서와 무관하게 실행마다 같은 값
+
+    occurrence가 2 이상이면 키가 같은 n번째 이벤트의 ID입니다 (자체 링크가 없어 사이트 기본 링크를 쓰는 이벤트).
+    """
+    event_id = f"{prefix}_{event_key({'source': source, 'link': link, 'title': title})[:12]}"
+    return event_id if occurrence == 1 else f"{event_id}_{occurrence}"
+
+
+def is_content_id(event_id):
+    """make_event_id로 만든 ID인지 확인 - 순번 방식의 예전 ID(cgv_1 등)면 False"""
+    return bool(_CONTENT_ID_RE.search(event_id))
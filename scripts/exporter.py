@@ -0,0 +1,152 @@
+import csv
+import hashlib
+import json
+import os
+import tempfile
+from contextlib import ExitStack, contextmanager
+from textwrap import indent
+
+# CSV 컬럼 순서 (events.json 이벤트 필드와 동일)
+EVENT_FIELDS = ['id', 'title', 'description', 'date', 'end_date', 'location', 'type', 'genre', 'image', 'source',
+                'link', 'created_at']
+
+# 새 파일 권한 계산용 umask (mkstemp 임시 파일은 0600이라 rename 전에 일반 파일 권한으로 바꿈)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+@contextmanager
+def atomic_write(path, encoding='utf-8', newline=None):
+    """같은 디렉토리의 임시 파일에 쓴 뒤 rename - 읽는 쪽은 항상 완성된 파일만 보게 됨"""
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding=encoding, newline=newline) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, _file_mode(path))
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _file_mode(path):
+    """교체할 파일의 권한 - 기존 파일이 있으면 그 권한, 없으면 open()으로 만든 파일과 같은 권한"""
+    try:
+        return os.stat(path).st_mode & 0o7777
+    except OSError:
+        return 0o666 & ~_UMASK
+
+
+def file_digest(path):
+    """파일 내용의 SHA-256 - 인덱스가 어떤 events.json으로 만든 것인지 표시하는 세대 값 (API가 같은 방식으로 계산)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(64 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def write_events(events, json_path=None, csv_path=None, observers=()):
+    """이벤트 이터레이터를 한 번 순회하며 JSON과 CSV 파일을 동시에 씀 - 쓴 이벤트 수 반환
+
+    JSON 출력은 json.dump(events, indent=2)와 같은 형식이고, 전체 목록을 메모리에 올리지 않습니다.
+    observers는 쓰는 순서대로 add(event)를 받습니다 (인덱스 생성용).
+    """
+    with ExitStack() as stack:
+        json_file = stack.enter_context(atomic_write(json_path)) if json_path else None
+        csv_writer = None
+        if csv_path:
+            # 엑셀에서 한글이 깨지지 않도록 BOM 포함
+            csv_file = stack.enter_context(atomic_write(csv_path, encoding='utf-8-sig', newline=''))
+            csv_writer = csv.DictWriter(csv_file, fieldnames=EVENT_FIELDS, extrasaction='ignore',
+                                        lineterminator='\n')
+            csv_writer.writeheader()
+
+        count = 0
+        if json_file:
+            json_file.write('[')
+        for event in events:
+            if json_file:
+                json_file.write(',\n' if count else '\n')
+                json_file.write(indent(json.dumps(event, ensure_ascii=False, indent=2), '  '))
+            if csv_writer:
+                csv_writer.writerow(event)
+            for observer in observers:
+                observer.add(event)
+            count += 1
+        if json_file:
+            json_file.write('\n]' if count else ']')
+    return count
+
+
+class EventShardWriter:
+    """날짜 내림차순으로 정렬한 이벤트를 고정 크기 페이지 파일(events-page-N.json)로 나눠 씀
+
+    매니페스트(events-manifest.json)에 전체 개수, 페이지별 날짜 범위와 내용 해시를 기록합니다.
+    내용이 그대로인 페이지 파일은 다시 쓰지 않으므로, 재크롤링 후에도 브라우저/CDN 캐시를 그대로 쓸 수 있습니다.
+    write_events의 observer로 사용합니다.
+    """
+
+    def __init__(self, directory, page_size=50, prefix='events-page-', manifest_name='events-manifest.json'):
+        self.directory = directory
+        self.page_size = page_size
+        self.prefix = prefix
+        self.manifest_name = manifest_name
+        self.events = []
+
+    def add(self, event):
+        self.events.append(event)
+
+    def _pages(self):
+        # 안정 정렬 - 날짜가 같으면 events.json 순서 유지 (API 정렬, 패싯 인덱스와 동일)
+        ordered = sorted(self.events, key=lambda event: event.get('date') or '', reverse=True)
+        for start in range(0, len(ordered), self.page_size):
+            yield ordered[start:start + self.page_size]
+
+    def _write_if_changed(self, path, data):
+        """내용이 같으면 기존 파일 유지 - 쓰면 True"""
+        try:
+            with open(path, 'rb') as f:
+                if f.read() == data:
+                    return False
+        except OSError:
+            pass
+        with atomic_write(path) as f:
+            f.write(data.decode('utf-8'))
+        return True
+
+    def write(self):
+        """페이지 파일과 매니페스트를 쓰고 새로 쓴 페이지 수를 반환"""
+        os.makedirs(self.directory, exist_ok=True)
+        pages = []
+        written = 0
+        for number, page in enumerate(self._pages(), start=1):
+            data = json.dumps(page, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            name = f"{self.prefix}{number}.json"
+            if self._write_if_changed(os.path.join(self.directory, name), data):
+                written += 1
+            pages.append({
+                'file': name,
+                'count': len(page),
+                'firstDate': page[0].get('date') or '',
+                'lastDate': page[-1].get('date') or '',
+                'hash': hashlib.sha256(data).hexdigest()[:16]
+            })
+
+        # 이벤트가 줄어 남은 이전 페이지 파일 삭제
+        current = {page['file'] for page in pages}
+        for name in os.listdir(self.directory):
+            if name.startswith(self.prefix) and name.endswith('.json') and name not in current:
+                os.remove(os.path.join(self.directory, name))
+
+        manifest = {'total': len(self.events), 'pageSize': self.page_size, 'pages': pages}
+        self._write_if_changed(os.path.join(self.directory, self.manifest_name),
+                               json.dumps(manifest, ensure_ascii=False, indent=2).encode('utf-8'))
+        return written
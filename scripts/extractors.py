@@ -0,0 +1,213 @@
+import logging
+import re
+import threading
+import time
+
+from crawl_state import fingerprint_elements
+from date_parser import parse_date_range
+from page_parser import parse_html
+from selector_engine import first_matches, matches_selector, select_fallback
+from structured_data import extract_structured_events
+from title_filter import clean_title, is_movie_related
+
+_BACKGROUND_IMAGE_RE = re.compile(r'background-image:\s*url\(["\']?([^"\']+)["\']?\)')
+
+logger = logging.getLogger(__name__)
+
+# 현재 스레드의 extract_page가 제목 필터에 쓴 시간 (단계별 시간 측정용)
+_filter_clock = threading.local()
+
+
+def _timed_filter(func):
+    """제목 필터 함수 호출 시간을 현재 스레드의 필터 시간에 누적"""
+    def timed(title):
+        start = time.perf_counter()
+        try:
+            return func(title)
+        finally:
+            _filter_clock.seconds = getattr(_filter_clock, 'seconds', 0.0) + time.perf_counter() - start
+    return timed
+
+
+_clean_title = _timed_filter(clean_title)
+_is_movie_related = _timed_filter(is_movie_related)
+
+
+def _absolute_url(src, base_url):
+    if src.startswith('http'):
+        return src
+    elif src.startswith('//'):
+        return 'https:' + src
+    else:
+        return base_url + src
+
+
+def extract_image_url(element, base_url, found=None):
+    """이미지 URL 추출 - found는 first_matches 결과 (이미 찾아둔 img 재사용)"""
+    # img 태그에서 src 추출
+    img = found.get('img') if found is not None else element.find('img')
+    if img:
+        src = img.get('src') or img.get('data-src')
+        if src:
+            return _absolute_url(src, base_url)
+
+    # background-image 스타일에서 추출
+    bg_match = _BACKGROUND_IMAGE_RE.search(element.get('style', ''))
+    if bg_match:
+        return _absolute_url(bg_match.group(1), base_url)
+
+    return None
+
+
+def _extract_link(element, found, base_url, link_parent=None):
+    """이벤트 링크 - 요소 자신, 하위 <a>, link_parent 선택자와 일치하는 조상, 가장 가까운 <a href> 조상 순서로 찾음"""
+    if element.name == 'a' and element.get('href'):
+        link_elem = element
+    else:
+        link_elem = found.get('a')
+        if link_elem is None and link_parent:
+            link_elem = next((parent for parent in element.parents
+                              if matches_selector(parent.name, parent.attrs, link_parent)), None)
+        if link_elem is None:
+            link_elem = element.find_parent('a', href=True)
+    link = link_elem.get('href') if link_elem else None
+    if link and not link.startswith('http'):
+        link = base_url + link
+    return link
+
+
+def _find_title(element, found, title_selectors):
+    """제목 선택자를 우선순위대로 시도하고, 없으면 전체 텍스트에서 첫 번째 의미있는 줄"""
+    title = ""
+    for selector in title_selectors:
+        title_elem = found.get(selector)
+        if title_elem:
+            title = title_elem.get_text(strip=True)
+            if _clean_title(title) and _is_movie_related(title):
+                break
+
+    if not title:
+        title = element.get_text(strip=True)
+        lines = [line.strip() for line in title.split('\n') if line.strip()]
+        for line in lines:
+            if _clean_title(line) and _is_movie_related(line) and len(line) > 5:
+                title = line
+                break
+    return title
+
+
+def extract_record(element, base_url, fields):
+    """이벤트 요소 하나에서 레코드 추출 - 영화 관련 제목이 없으면 None
+
+    fields는 사이트 어댑터의 필드 선택자입니다 (sites.SiteAdapter 참고).
+    title_mode가 'search'(기본)면 제목 선택자를 우선순위대로 시도한 뒤 요소 텍스트에서 찾고,
+    'element'면 요소 자신이나 첫 번째로 찾은 제목 요소의 텍스트를 그대로 씁니다.
+    date/end_date는 첫 번째 날짜 요소의 기간, description은 첫 번째 설명 요소의 텍스트입니다.
+    link는 요소 안에 없으면 요소를 감싼 링크(link_parent 선택자, 없으면 가장 가까운 <a href>)에서 가져옵니다.
+    """
+    title_selectors = fields['title']
+    date_selectors = fields.get('date', [])
+    desc_selectors = fields.get('description', [])
+    # 제목/날짜/설명/이미지/링크 요소를 한 번의 하위 트리 순회로 찾기
+    found = first_matches(element, title_selectors + date_selectors + desc_selectors + ['img', 'a'])
+
+    if fields.get('title_mode', 'search') == 'element':
+        if any(matches_selector(element.name, element.attrs, selector) for selector in title_selectors):
+            title_elem = element
+        else:
+            title_elem = _first_found(found, title_selectors) or element
+        title = _clean_title(title_elem.get_text(strip=True))
+    else:
+        title = _clean_title(_find_title(element, found, title_selectors))
+    if not title or not _is_movie_related(title):
+        return None
+
+    date_elem = _first_found(found, date_selectors)
+    desc_elem = _first_found(found, desc_selectors)
+    period = parse_date_range(date_elem.get_text(strip=True)) if date_elem else None
+    return {
+        'title': title,
+        'description': desc_elem.get_text(strip=True) if desc_elem else None,
+        'date': period.start if period else None,
+        'end_date': period.end if period else None,
+        'location': None,
+        'image': extract_image_url(element, base_url, found),
+        'link': _extract_link(element, found, base_url, fields.get('link_parent'))
+    }
+
+
+def parse_scope(selectors, fields):
+    """범위 파싱 선택자 - 이벤트 요소와, 요소를 감싼 링크(link_parent)가 있으면 그 링크까지 트리에 남김"""
+    return selectors + [fields['link_parent']] if fields.get('link_parent') else selectors
+
+
+def _first_found(found, selectors):
+    for selector in selectors:
+        if found.get(selector):
+            return found[selector]
+    return None
+
+
+def extract_page(site, content, selectors, fields, base_url, limit, parser=None, scoped=True,
+                 known_fingerprint=None):
+    """목록 페이지 하나에서 이벤트 레코드 추출 - 프로세스 풀에서 실행할 수 있도록 모듈 함수로 둠
+
+    페이지에 포함된 JSON을 먼저 보고, 없으면 선택자로 이벤트 요소를 찾아 사이트 어댑터의 필드 선택자(fields)로
+    레코드를 만듭니다.
+    반환값은 {'structured', 'count', 'filtered', 'fingerprint', 'records', 'timings'} 딕셔너리입니다.
+    filtered는 제목 필터 등으로 제외한 요소 수, timings는 단계별 소요 시간(초)입니다
+    (structured, parse, select, extract, filter - extract에는 filter 시간이 빠져 있음).
+    지문이 known_fingerprint와 같으면 추출을 생략하고 records는 None입니다.
+    """
+    timings = {}
+    _filter_clock.seconds = 0.0
+    start = time.perf_counter()
+    # 메뉴/배너 등 이벤트가 아닌 레코드는 제외 - 남는 레코드가 없으면 DOM 추출로 대체
+    candidates = extract_structured_events(content, base_url)
+    timings['structured'] = time.perf_counter() - start
+    passed = [record for record in candidates
+              if _clean_title(record['title']) and _is_movie_related(record['title'])]
+    records = passed[:limit]
+    if records:
+        timings['filter'] = _filter_clock.seconds
+        result = {'structured': True, 'count': len(records), 'filtered': len(candidates) - len(passed),
+                  'fingerprint': fingerprint_elements(records), 'records': None, 'timings': timings}
+        if result['fingerprint'] == known_fingerprint:
+            return result
+        for record in records:
+            record['title'] = clean_title(record['title'])
+        result['records'] = records
+        return result
+
+    _filter_clock.seconds = 0.0
+    start = time.perf_counter()
+    soup = parse_html(content, scope=parse_scope(selectors, fields) if scoped else None, parser=parser)
+    timings['parse'] = time.perf_counter() - start
+    try:
+        start = time.perf_counter()
+        elements = select_fallback(soup, selectors)
+        timings['select'] = time.perf_counter() - start
+        fingerprint = fingerprint_elements(elements[:limit])
+        result = {'structured': False, 'count': len(elements), 'filtered': 0, 'fingerprint': fingerprint,
+                  'records': None, 'timings': timings}
+        if fingerprint == known_fingerprint:
+            return result
+
+        result['records'] = []
+        start = time.perf_counter()
+        for element in elements[:limit]:
+            try:
+                record = extract_record(element, base_url, fields)
+            except Exception as e:
+                logger.warning("이벤트 요소 파싱 오류", extra={'site': site, 'error': str(e)})
+                continue
+            if record:
+                result['records'].append(record)
+            else:
+                result['filtered'] += 1
+        timings['filter'] = _filter_clock.seconds
+        timings['extract'] = time.perf_counter() - start - timings['filter']
+        return result
+    finally:
+        # 레코드는 일반 문자열만 담고 있으므로 트리는 바로 해제 (요소 간 순환 참조로 늦게 회수되는 것 방지)
+        soup.decompose()
@@ -0,0 +1,81 @@
+import html
+import re
+from collections import deque
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+
+# 다음 페이지 링크 - rel="next" 또는 class 토큰에 정확히 next가 있는 <a> 태그
+# ('더보기'(btn-more 등)는 상세 페이지로 가는 경우가 많아 다음 페이지로 보지 않음)
+_ANCHOR_RE = re.compile(r'<a\b[^>]*>', re.I)
+_HREF_RE = re.compile(r'\bhref\s*=\s*["\']([^"\']+)["\']', re.I)
+_NEXT_RE = re.compile(r'\brel\s*=\s*["\']?next\b|\bclass\s*=\s*(["\'])(?:[^"\']*\s)?next(?:\s[^"\']*)?\1', re.I)
+
+
+def normalize_url(url):
+    """본 URL 비교용 - 프래그먼트 제거"""
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, parts.query, ''))
+
+
+def next_page_links(content, url):
+    """목록 페이지 원문에서 같은 호스트의 다음 페이지 링크 (HTML 파싱 없이 정규식으로 찾음)"""
+    text = content.decode('utf-8', errors='replace') if isinstance(content, bytes) else content
+    host = urlsplit(url).netloc
+    links = []
+    for anchor in _ANCHOR_RE.finditer(text):
+        tag = anchor.group(0)
+        href = _HREF_RE.search(tag)
+        if not href or not _NEXT_RE.search(tag):
+            continue
+        link = normalize_url(urljoin(url, html.unescape(href.group(1))))
+        if urlsplit(link).netloc == host and link not in links:
+            links.append(link)
+    return links
+
+
+def page_number(url, param):
+    """URL의 페이지 번호 쿼리 값 - 없거나 숫자가 아니면 1"""
+    value = dict(parse_qsl(urlsplit(url).query)).get(param, '')
+    return int(value) if value.isdigit() else 1
+
+
+def page_url(url, param, page):
+    """페이지 번호 쿼리만 바꾼 URL"""
+    parts = urlsplit(url)
+    query = [(key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True) if key != param]
+    query.append((param, str(page)))
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), ''))
+
+
+class Frontier:
+    """사이트 하나의 목록 페이지 대기열 - 본 URL 집합과 깊이/페이지 예산
+
+    시작 URL은 깊이 0이고, 다음 페이지는 발견한 페이지의 깊이 + 1입니다. 한 번 넣은 URL은 다시 넣지 않으며,
+    max_depth보다 깊거나 이미 max_pages개를 넣었으면 더 받지 않고 truncated를 True로 표시합니다
+    (목록 전체를 보지 못했을 수 있음). 먼저 넣은 URL부터 꺼냅니다.
+    """
+
+    def __init__(self, max_pages=50, max_depth=20):
+        self.max_pages = max_pages
+        self.max_depth = max_depth
+        self.seen = set()
+        self.queue = deque()
+        self.truncated = False
+
+    def add(self, url, depth=0):
+        """대기열에 추가하고 True 반환 - 이미 봤거나 예산을 넘으면 False"""
+        url = normalize_url(url)
+        if url in self.seen:
+            return False
+        if depth > self.max_depth or len(self.seen) >= self.max_pages:
+            self.truncated = True
+            return False
+        self.seen.add(url)
+        self.queue.append((url, depth))
+        return True
+
+    def pop(self):
+        """다음 (URL, 깊이) - 비어 있으면 None"""
+        return self.queue.popleft() if self.queue else None
+
+    def __len__(self):
+        return len(self.queue)
@@ -0,0 +1,115 @@
+import hashlib
+import json
+import os
+import time
+
+
+class HttpCache:
+    """URL 단위 디스크 응답 캐시
+
+    응답 본문과 ETag / Last-Modified 값을 저장해 두고 다음 요청에서 조건부 GET 헤더로 보냅니다.
+    304 응답이면 크롤러는 저장된 추출 결과(CrawlState)나 캐시된 본문을 사용합니다.
+    오래된 항목(max_age 초)과 전체 용량 초과분(max_bytes)은 evict()에서 정리합니다.
+    """
+
+    def __init__(self, directory='.cache/http', max_bytes=50 * 1024 * 1024, max_age=7 * 24 * 3600):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, url, suffix):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, key + suffix)
+
+    def _write(self, path, data):
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _load_meta(self, url):
+        try:
+            with open(self._path(url, '.json'), encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() - meta.get('stored_at', 0) > self.max_age:
+            self.delete(url)
+            return None
+        return meta
+
+    def _save_meta(self, url, meta):
+        meta['accessed_at'] = time.time()
+        self._write(self._path(url, '.json'), json.dumps(meta, ensure_ascii=False).encode('utf-8'))
+
+    def validators(self, url):
+        """조건부 GET 요청 헤더"""
+        meta = self._load_meta(url)
+        if not meta:
+            return {}
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+
+    def store(self, url, response):
+        """200 응답 저장 (검증 헤더가 없으면 조건부 GET을 할 수 없으므로 저장하지 않음)"""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+        self._write(self._path(url, '.body'), response.content)
+        self._save_meta(url, {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'stored_at': time.time(),
+            'size': len(response.content)
+        })
+
+    def revalidated(self, url):
+        """304 응답 - 항목의 유효 기간 갱신"""
+        meta = self._load_meta(url)
+        if meta:
+            meta['stored_at'] = time.time()
+            self._save_meta(url, meta)
+
+    def load_body(self, url):
+        try:
+            with open(self._path(url, '.body'), 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def delete(self, url):
+        for suffix in ('.json', '.body'):
+            try:
+                os.remove(self._path(url, suffix))
+            except OSError:
+                pass
+
+    def evict(self):
+        """만료된 항목 삭제 후, 용량을 넘으면 오래 사용하지 않은 항목부터 삭제"""
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith('.json'):
+                continue
+            try:
+                with open(os.path.join(self.directory, name), encoding='utf-8') as f:
+                    meta = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if time.time() - meta.get('stored_at', 0) > self.max_age:
+                self.delete(meta['url'])
+            else:
+                entries.append(meta)
+
+        total = sum(meta.get('size', 0) for meta in entries)
+        for meta in sorted(entries, key=lambda m: m.get('accessed_at', 0)):
+            if total <= self.max_bytes:
+                break
+            self.delete(meta['url'])
+            total -= meta.get('size', 0)
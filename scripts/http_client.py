@@ -0,0 +1,137 @@
+import random
+import threading
+import time
+from urllib.parse import urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from rate_limiter import parse_retry_after
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# 재시도 대상 상태 코드 (요청 과다, 서버 오류)
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# 호스트가 요청 속도를 줄이라고 알리는 상태 코드
+THROTTLE_STATUS_CODES = {429, 503}
+
+# 본문 스트리밍 읽기 단위 - 작을수록 다운로드 중단 시점이 정확함
+CHUNK_SIZE = 16 * 1024
+
+
+class ResponseTooLarge(requests.RequestException):
+    """응답 본문이 요청한 최대 크기(max_bytes)를 넘음"""
+
+
+class HttpClient:
+    """크롤러 공용 HTTP 요청 레이어
+
+    하나의 requests.Session을 공유해서 호스트별 커넥션 풀과 keep-alive를 사용하고,
+    5xx 응답과 타임아웃/연결 오류(스트리밍 본문을 읽는 도중 포함)는 지터가 들어간 지수 백오프로 재시도합니다.
+    rate_limiter(HostRateLimiter)가 있으면 모든 요청 전에 호스트별 토큰을 받고,
+    429/503 응답과 Retry-After 헤더를 제한기에 알려 해당 호스트의 속도를 줄입니다.
+    get()에 max_bytes를 주면 본문을 스트리밍으로 읽으면서 크기를 제한하고, stop_reading(청크 -> bool)이
+    True를 돌려주면 나머지 본문은 받지 않고 연결을 닫습니다 (response.truncated = True).
+    host_overrides({호스트: 'http://127.0.0.1:8765'})가 있으면 해당 호스트 요청을 그 주소로 보내고
+    원래 호스트는 Host 헤더로 전달합니다 (로컬 대역 서버 테스트용). 속도 제한은 원래 호스트 기준입니다.
+    """
+
+    def __init__(self, headers=None, timeout=10, pool_connections=10, pool_maxsize=10,
+                 max_retries=3, backoff_base=0.5, backoff_max=8.0, rate_limiter=None, host_overrides=None):
+        self.timeout = timeout
+        self.host_overrides = host_overrides or {}
+        self.rate_limiter = rate_limiter
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retries = 0
+        self._retries_lock = threading.Lock()
+
+        self.session = requests.Session()
+        self.session.headers.update(headers or DEFAULT_HEADERS)
+        # pool_connections: 캐시할 호스트별 풀 개수, pool_maxsize: 호스트당 유지할 커넥션 수
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def _backoff(self, attempt):
+        """재시도 대기 시간 (full jitter 지수 백오프)"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def _route(self, url, kwargs):
+        """host_overrides에 있는 호스트면 요청 주소를 바꾸고 Host 헤더에 원래 호스트 지정"""
+        parts = urlsplit(url)
+        target = self.host_overrides.get(parts.netloc)
+        if not target:
+            return url
+        target = urlsplit(target)
+        kwargs['headers'] = dict(kwargs.get('headers') or {}, Host=parts.netloc)
+        return urlunsplit((target.scheme, target.netloc, parts.path, parts.query, ''))
+
+    def _count_retry(self):
+        with self._retries_lock:
+            self.retries += 1
+
+    def _read_body(self, response, max_bytes=None, stop_reading=None):
+        """스트리밍 응답 본문을 읽어 response.content로 설정 - max_bytes를 넘으면 연결을 닫고 예외"""
+        response.truncated = False
+        length = response.headers.get('Content-Length', '')
+        if max_bytes and length.isdigit() and int(length) > max_bytes:
+            response.close()
+            raise ResponseTooLarge(f"응답이 너무 큽니다 ({length} > {max_bytes} 바이트): {response.url}")
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(CHUNK_SIZE):
+            size += len(chunk)
+            if max_bytes and size > max_bytes:
+                response.close()
+                raise ResponseTooLarge(f"응답이 너무 큽니다 (> {max_bytes} 바이트): {response.url}")
+            chunks.append(chunk)
+            if stop_reading and stop_reading(chunk):
+                response.truncated = True
+                response.close()
+                break
+        response._content = b''.join(chunks)
+        return response
+
+    def get(self, url, max_bytes=None, stop_reading=None, **kwargs):
+        """GET 요청 - 마지막 시도까지 실패하면 예외 또는 마지막 응답을 그대로 반환"""
+        kwargs.setdefault('timeout', self.timeout)
+        target = self._route(url, kwargs)
+        streaming = bool(max_bytes or stop_reading)
+        if streaming:
+            kwargs['stream'] = True
+        for attempt in range(self.max_retries + 1):
+            if self.rate_limiter:
+                self.rate_limiter.acquire(url)
+            retry_after = None
+            response = None
+            try:
+                response = self.session.get(target, **kwargs)
+                if response.status_code in THROTTLE_STATUS_CODES:
+                    retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                    if self.rate_limiter:
+                        self.rate_limiter.penalize(url, retry_after)
+                elif self.rate_limiter and response.status_code < 400:
+                    self.rate_limiter.reward(url)
+                if response.status_code not in RETRY_STATUS_CODES or attempt == self.max_retries:
+                    # 스트리밍 본문도 재시도 범위 안에서 읽음 - 본문 도중의 타임아웃/연결 끊김도 다시 요청
+                    return self._read_body(response, max_bytes, stop_reading) if streaming else response
+                response.close()
+            except (requests.Timeout, requests.ConnectionError, requests.exceptions.ChunkedEncodingError):
+                if response is not None:
+                    response.close()
+                if attempt == self.max_retries:
+                    raise
+
+            self._count_retry()
+            if retry_after is None:
+                time.sleep(self._backoff(attempt))
+            elif not self.rate_limiter:
+                time.sleep(retry_after)
+
+    def close(self):
+        self.session.close()
@@ -1,473 +1,705 @@
-import requests
-from bs4 import BeautifulSoup
 import json
-import pandas as pd
 from datetime import datetime, timedelta
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import zip_longest
+from urllib.parse import urlparse
+import argparse
+import logging
 import time
 import random
 import os
-import re
+import sys
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from columnar_export import COLUMNAR_FORMATS, ColumnarHistoryWriter, columnar_available
+from crawl_state import CrawlState
+from detail_pages import parse_detail, stream_details
+from event_ids import is_content_id, make_event_id
+from exporter import EventShardWriter, file_digest, write_events
+from extractors import extract_page
+from frontier import Frontier, next_page_links, page_number, page_url
+from http_cache import HttpCache
+from http_client import HttpClient
+from indexes import FacetIndexBuilder, SearchIndexBuilder
+from instrumentation import LOG_FORMATS, Metrics, configure_logging
+from page_parser import PARSERS, ContainerWatcher
+from rate_limiter import HostRateLimiter
+from sites import load_adapters, parse_sites, site_names
+
+logger = logging.getLogger('crawler')
+
+# 304 응답이고 이전 추출 결과가 저장되어 있을 때 fetch_page가 돌려주는 값
+NOT_MODIFIED = object()
+
+# 이벤트 데이터 저장 디렉토리
+DATA_DIR = 'public/data'
+
+# 페이지당 최대 응답 크기 (바이트) - 넘으면 해당 페이지는 오류로 처리
+MAX_PAGE_BYTES = 5 * 1024 * 1024
+
+# 사이트별 목록 페이지 예산 - 최대 페이지 수, 시작 URL에서 따라갈 최대 깊이
+MAX_LISTING_PAGES = 50
+MAX_LISTING_DEPTH = 20
+
+
+def peak_memory_mb():
+    """이 프로세스와 종료된 하위 프로세스(파싱 풀) 중 가장 큰 최대 메모리 사용량(MB) - 확인할 수 없으면 None"""
+    if resource is None:
+        return None
+    peak = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+               resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    # ru_maxrss 단위 - Linux는 KB, macOS는 바이트
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def interleave_hosts(urls):
+    """호스트를 번갈아 가며 URL 나열 - 한 호스트의 속도 제한을 기다리는 작업이 풀을 독점하지 않게 함"""
+    by_host = {}
+    for url in urls:
+        by_host.setdefault(urlparse(url).netloc, []).append(url)
+    return [url for group in zip_longest(*by_host.values()) for url in group if url]
+
 
 class ImprovedMovieEventCrawler:
-    def __init__(self):
+    """영화 이벤트 크롤러 - 사이트 어댑터(sites 패키지)의 설정으로 사이트마다 같은 수집 과정을 실행"""
+
+    def __init__(self, concurrent=True, max_workers=6, rate=0.7, burst=1, pool_size=10, http=None,
+                 cache=None, parser=None, scoped=True, state=None, history_format=None, history_dir='data/history',
+                 details=True, parse_workers=0, max_page_bytes=MAX_PAGE_BYTES, max_in_flight=0, early_abort=True,
+                 metrics=None, metrics_file=None, prometheus_file=None, max_pages=MAX_LISTING_PAGES,
+                 max_depth=MAX_LISTING_DEPTH, page_lookahead=2, sites=None):
+        # 크롤링할 사이트의 어댑터 (None이면 등록된 모든 사이트) - 선택한 사이트의 모듈만 불러옴
+        self.adapters = load_adapters(sites)
+        # 일부 사이트만 실행하면 나머지 사이트의 기존 이벤트는 그대로 둠
+        self.partial = set(self.adapters) != set(site_names())
         self.events = []
+        # 이번 실행에서 추가한 이벤트 ID - 중복 이벤트를 O(1)로 거르기 위한 인덱스
+        self.event_ids = set()
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
+        # 모든 크롤링 요청이 공유하는 HTTP 세션 (호스트별 커넥션 풀 + 재시도)
+        # 호스트별 요청 속도는 토큰 버킷으로 제한 (초당 rate개, 최대 burst개 연속)
+        self.http = http or HttpClient(headers=self.headers, pool_maxsize=max(pool_size, max_workers),
+                                       rate_limiter=HostRateLimiter(rate=rate, burst=burst,
+                                                                    host_rates=self.host_rates(rate, burst)))
+        # 조건부 GET용 디스크 캐시 (None이면 사용하지 않음)
+        self.cache = cache
+        # 증분 크롤링 상태 (None이면 매번 전체 추출 후 덮어쓰기)
+        self.state = state
+        self.existing_events = {}
+        self._page_fingerprints = {}
+        self._page_events = []
+        # 이번 실행에서 새로 추출했거나 내용이 바뀐 이벤트 ID - 상세 페이지를 다시 받을 대상
+        self._changed_event_ids = set()
+        # 목록 페이지를 오류 없이 끝까지 받은 사이트의 출처 - 이번 목록에 없는 기존 이벤트를 지울 수 있음
+        self.complete_sources = set()
+        # 이번 실행에서 받았거나 오류가 난 목록 페이지 URL (404 제외) - 상태 파일에서 나머지 페이지 항목을 지울 때 사용
+        self.seen_pages = set()
+        # 상세 페이지에서 실제 기간/장소 추출 여부
+        self.details = details
+        # HTML 파서 백엔드 (None이면 lxml, 없으면 html.parser)와 범위 파싱 여부
+        self.parser = parser
+        self.scoped = scoped
+        # 분석용 컬럼 포맷 이력 저장 (None이면 저장하지 않음)
+        self.history_format = history_format
+        self.history_dir = history_dir
+        # 동시 크롤링 설정
+        self.concurrent = concurrent
+        self.max_workers = max_workers
+        # 미리 받아둔 페이지(다운로드 작업)와 아직 시작하지 않은 URL 대기열
+        self._pages = {}
+        self._prefetch_queue = deque()
+        self._prefetch_executor = None
+        self._listing_sites = {url: site for site, adapter in self.adapters.items() for url in adapter.listing_urls}
+        # 상세 페이지 등 URL의 사이트 구분용 (호스트 -> 사이트)
+        self._host_sites = {urlparse(url).netloc: site for url, site in self._listing_sites.items()}
+        self._host_sites.update((urlparse(adapter.base_url).netloc, site) for site, adapter in self.adapters.items())
+        # 메모리 제한 - 페이지당 최대 응답 크기, 받아두고 처리하지 않은 페이지 최대 개수 (0이면 제한 없음)
+        self.max_page_bytes = max_page_bytes
+        self.max_in_flight = max_in_flight
+        # 사이트별 목록 페이지 예산과 처리 중인 페이지 다음으로 미리 요청해둘 페이지 수
+        self.max_pages = max_pages
+        self.max_depth = max_depth
+        self.page_lookahead = page_lookahead
+        # 목록 페이지에서 이벤트 목록이 닫히면 나머지(바닥글, 스크립트 등)는 받지 않음
+        self.early_abort = early_abort
+        # 목록 페이지 추출용 프로세스 수 (0이면 메인 프로세스에서 추출)와 제출해둔 추출 작업
+        self.parse_workers = parse_workers
+        self.parse_pool = None
+        self._extractions = {}
+        # 사이트별 단계 시간/카운터 - 실행이 끝나면 JSON과 Prometheus 텍스트 파일로 저장 (경로가 None이면 저장 안 함)
+        self.metrics = metrics or Metrics()
+        self.metrics_file = metrics_file
+        self.prometheus_file = prometheus_file
     
-    def clean_title(self, title):
-        """제목 정리 및 개선 - 강화된 필터링"""
-        if not title:
-            return ""
-        
-        # 불필요한 문자 제거
-        title = re.sub(r'[^\w\s가-힣\[\]()<>]', '', title)
-        title = title.strip()
-        
-        # 너무 짧은 제목 필터링
-        if len(title) < 5:
-            return ""
-        
-        # 의미없는 제목 필터링 - 강화된 버전
-        meaningless = [
-            '더보기', '이전', '다음', '닫기', '보기', '이벤트', 'EVENT',
-            '사업자정보확인', '당첨자발표', '당첨자', '발표', '확인',
-            '공지사항', '안내', '알림', '정보', '관련', '문의',
-            '고객센터', '고객지원', '고객서비스', '고객안내',
-            '이용약관', '개인정보처리방침', '개인정보', '약관',
-            '로그인', '회원가입', '마이페이지', '예매', '예약',
-            '상영시간', '상영관', '영화관', '극장', '매장',
-            '홈', '메인', '메뉴', '검색', '찾기', '바로가기',
-            '새창', '팝업', '레이어', '모달', '다이얼로그',
-            '버튼', '링크', '클릭', '터치', '스와이프',
-            '로딩', '로드', '업로드', '다운로드', '업데이트',
-            '새로고침', '새로고침', '새로고침', '새로고침',
-            'copyright', 'all rights reserved', 'copyright',
-            '주식회사', '㈜', '(주)', '유한회사', '(유)',
-            'corporation', 'company', 'inc', 'ltd', 'co',
-            '서울', '부산', '대구', '인천', '광주', '대전', '울산',
-            '강남', '강북', '강서', '강동', '서초', '송파',
-            '마포', '영등포', '용산', '성동', '광진', '동대문',
-            '중랑', '성북', '강북', '도봉', '노원', '은평',
-            '양천', '구로', '금천', '동작', '관악', '서초',
-            '강남', '송파', '강동', '광주', '경기', '인천',
-            '부산', '대구', '울산', '대전', '세종', '충북',
-            '충남', '전북', '전남', '경북', '경남', '제주'
-        ]
-        
-        # 정확히 일치하는 경우 제외
-        if title.lower() in [word.lower() for word in meaningless]:
-            return ""
-        
-        # 포함하는 경우도 제외 (더 엄격하게)
-        for word in meaningless:
-            if word.lower() in title.lower():
-                return ""
+    def host_rates(self, rate, burst):
+        """어댑터에 요청 속도가 지정된 사이트의 {호스트: (초당 요청 수, 연속 요청 수)}"""
+        rates = {}
+        for adapter in self.adapters.values():
+            if adapter.rate is None and adapter.burst is None:
+                continue
+            limit = (adapter.rate if adapter.rate is not None else rate,
+                     adapter.burst if adapter.burst is not None else burst)
+            for url in adapter.listing_urls + [adapter.base_url]:
+                rates[urlparse(url).netloc] = limit
+        return rates
+    
+    def site_for(self, url):
+        """URL이 속한 사이트 - 알 수 없으면 None"""
+        return self._listing_sites.get(url) or self._host_sites.get(urlparse(url).netloc)
+    
+    def _download(self, url):
+        """URL 하나를 다운로드하고 사이트별 fetch 시간, 요청 수, 받은 바이트 수 기록"""
+        site = self.site_for(url)
+        try:
+            with self.metrics.timer('fetch', site):
+                content = self._fetch(url)
+        except Exception:
+            self.metrics.increment('fetch_errors', site)
+            raise
+        self.metrics.increment('pages_fetched', site)
+        if content is NOT_MODIFIED:
+            self.metrics.increment('pages_not_modified', site)
+        else:
+            self.metrics.increment('bytes_downloaded', site, len(content))
+        return content
+    
+    def _fetch(self, url):
+        """URL 하나를 다운로드 - 캐시가 있으면 조건부 GET"""
+        headers = self.cache.validators(url) if self.cache else {}
+        site = self._listing_sites.get(url)
+        watcher = None
+        if self.early_abort and site and self.adapters[site].early_abort:
+            # 기본(첫 번째) 컨테이너 선택자만 감시 - 대체 선택자는 머리글 메뉴 링크 등과도 일치함
+            watcher = ContainerWatcher(self.adapters[site].container_selectors[:1])
+        response = self.http.get(url, headers=headers, max_bytes=self.max_page_bytes,
+                                 stop_reading=watcher.feed_bytes if watcher else None)
         
-        # 숫자만 있는 경우 제외
-        if re.match(r'^[\d\s\-\.]+$', title):
-            return ""
+        if response.status_code == 304:
+            self.cache.revalidated(url)
+            if self.state and self.state.page_events(url) is not None:
+                return NOT_MODIFIED
+            body = self.cache.load_body(url)
+            if body is not None:
+                return body
+            # 캐시 본문이 사라진 경우 - 항목을 지우고 다시 받기
+            self.cache.delete(url)
+            return self._fetch(url)
         
-        # 특수문자만 있는 경우 제외
-        if re.match(r'^[^\w가-힣]+$', title):
-            return ""
+        response.raise_for_status()
+        if getattr(response, 'truncated', False):
+            self.metrics.increment('pages_truncated', site)
+            logger.debug("이벤트 목록 이후 다운로드 중단", extra={'url': url, 'bytes': len(response.content)})
+        # 중단한 본문도 이벤트 목록은 모두 담고 있으므로 그대로 캐시 (304일 때 추출에 사용)
+        if self.cache:
+            self.cache.store(url, response)
+        return response.content
+    
+    def _download_safely(self, url):
+        """prefetch용 다운로드 - 오류는 결과로 보관했다가 파싱 시점에 다시 발생"""
+        try:
+            return self._download(url)
+        except Exception as e:
+            return e
+    
+    def prefetch_pages(self, urls):
+        """페이지 미리 받기 시작 - 받는 대로 파싱 프로세스 풀에 추출 작업 제출
         
-        return title
+        max_in_flight가 있으면 처리 순서대로 그 개수만큼만 받아두고, 한 페이지를 처리할 때마다
+        다음 페이지를 받기 시작합니다. 제한이 없으면 호스트를 번갈아 가며 모두 제출합니다.
+        """
+        self._prefetch_executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        self._prefetch_queue.extend(urls if self.max_in_flight else interleave_hosts(urls))
+        self._fill_prefetch_window()
+    
+    def prefetch_more(self, urls):
+        """새로 발견한 페이지도 미리 받기 - 미리 받기를 시작하지 않았으면(순차 모드) 아무것도 하지 않음
+
+        지금 처리 중인 사이트의 다음 페이지라 다른 사이트의 시작 URL보다 먼저 처리하므로 대기열 앞에 넣습니다.
+        """
+        if self._prefetch_executor:
+            self._prefetch_queue.extendleft(reversed(urls))
+            self._fill_prefetch_window()
+    
+    def _fill_prefetch_window(self):
+        while self._prefetch_queue and (not self.max_in_flight or len(self._pages) < self.max_in_flight):
+            url = self._prefetch_queue.popleft()
+            self._pages[url] = self._prefetch_executor.submit(self._prefetch, url)
+    
+    def _prefetch(self, url):
+        """다운로드 작업 - 목록 페이지면 본문을 돌려주기 전에 추출 작업을 먼저 제출"""
+        content = self._download_safely(url)
+        site = self._listing_sites.get(url)
+        if self.parse_pool and isinstance(content, bytes) and site:
+            self._extractions[url] = self.parse_pool.submit(extract_page, *self._extract_args(url, content, site))
+        return content
+    
+    def finish_prefetch(self):
+        if self._prefetch_executor:
+            self._prefetch_queue.clear()
+            self._prefetch_executor.shutdown()
+            self._prefetch_executor = None
+        self._pages.clear()
+    
+    def fetch_page(self, url):
+        """페이지 HTML 가져오기 - 미리 받기 시작한 페이지가 있으면 그 결과 사용"""
+        future = self._pages.pop(url, None)
+        if future is not None:
+            content = future.result()
+            self._fill_prefetch_window()
+        else:
+            # 아직 제출하지 않은 URL이면 대기열에서 빼서 나중에 다시 받지 않게 함
+            if url in self._prefetch_queue:
+                self._prefetch_queue.remove(url)
+            content = self._download(url)
+        if isinstance(content, Exception):
+            raise content
+        return content
     
-    def is_movie_related(self, title):
-        """영화 관련 이벤트인지 확인"""
-        if not title:
+    def skip_unchanged_page(self, url, fingerprint):
+        """이벤트 컨테이너 지문이 지난번과 같으면 저장된 결과를 사용하고 True 반환"""
+        self._page_fingerprints[url] = fingerprint
+        self._page_events = []
+        if self.state and self.state.page_unchanged(url, fingerprint):
+            self.reuse_page_events(url)
+            return True
+        return False
+    
+    def remember_events(self, url):
+        """페이지에서 추출한 이벤트를 저장 (다음 실행에서 304 또는 같은 지문이면 재사용)"""
+        if self.state and url in self._page_fingerprints:
+            self.state.set_page(url, self._page_fingerprints[url], self._page_events)
+    
+    def reuse_page_events(self, url):
+        """변경 없는 페이지 - 추출 없이 지난번 결과 사용"""
+        events = self.state.page_events(url)
+        site = self.site_for(url)
+        with self.metrics.timer('dedup', site):
+            for event in events:
+                self.add_event(event)
+        self.metrics.increment('events_reused', site, len(events))
+        logger.info("변경 없음 - 저장된 이벤트 재사용", extra={'site': site, 'url': url, 'count': len(events)})
+    
+    def add_event(self, event):
+        """이벤트 추가 - 이미 추가한 이벤트면 False 반환
+
+        지난 데이터와 내용 지문이 같으면 기존 레코드(날짜, 유형 등)를 유지합니다.
+        """
+        # 중복이어도 페이지 추출 결과에는 남겨서 페이지 단위 재사용 시 빠지지 않게 함
+        self._page_events.append(event)
+        if event['id'] in self.event_ids:
             return False
+        if self.state:
+            existing = self.existing_events.get(event['id'])
+            if existing and self.state.event_unchanged(event):
+                event = dict(existing, id=event['id'])
+            else:
+                self._changed_event_ids.add(event['id'])
+            self.state.set_event(event)
+        else:
+            self._changed_event_ids.add(event['id'])
+        self.event_ids.add(event['id'])
+        self.events.append(event)
+        return True
+    
+    def load_existing_events(self):
+        """기존 events.json을 이벤트 ID 기준으로 읽기"""
+        try:
+            with open(os.path.join(DATA_DIR, 'events.json'), encoding='utf-8') as f:
+                events = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        existing = {}
+        for event in events:
+            try:
+                # 순번 방식의 예전 ID는 내용 기반 ID로 변환
+                if not is_content_id(event['id']):
+                    prefix = event['id'].rsplit('_', 1)[0]
+                    event['id'] = make_event_id(prefix, event['source'], event['link'], event['title'])
+                existing[event['id']] = event
+            except (KeyError, AttributeError):
+                continue
+        return existing
+    
+    def merged_events(self):
+        """기존 데이터에 이번 실행 결과를 upsert - 기존 순서 유지, 새 이벤트는 뒤에 추가
+
+        목록 페이지를 모두 받은 사이트는 이번 목록에 없는 기존 이벤트(종료되었거나 제목/링크가 바뀐 이벤트)를
+        뺍니다. 오류나 페이지 예산 때문에 목록 일부만 본 사이트의 기존 이벤트는 그대로 둡니다.
+        """
+        current = {event['id']: event for event in self.events}
+        merged = {}
+        for event_id, event in self.existing_events.items():
+            if event_id in current or event['source'] not in self.complete_sources:
+                merged[event_id] = event
+            elif self.state:
+                self.state.forget_event(event_id)
+        removed = len(self.existing_events) - len(merged)
+        if removed:
+            self.metrics.increment('events_removed', value=removed)
+            logger.info("목록에서 사라진 이벤트 제외", extra={'count': removed})
+        merged.update(current)
+        return merged.values()
+    
+    def prune_state(self):
+        """이번 실행에서 보지 않은 목록 페이지와 이벤트 링크의 상태 항목 삭제 - 실행하지 않은 사이트의 항목은 유지"""
+        links = {event['link'] for event in self.events}
+        self.state.prune(lambda url: url in self.seen_pages or self.site_for(url) is None,
+                         lambda link: link in links or self.site_for(link) is None)
+    
+    def fetch_event_details(self):
+        """이벤트 링크의 상세 페이지에서 실제 기간과 장소 추출 (목록 수집 다음 단계)
         
-        # 영화 관련 키워드
-        movie_keywords = [
-            '시사회', '프리미어', '개봉', '상영', '영화', '무비', 'movie',
-            '감독', '배우', '주연', '조연', '출연', '연출', '제작',
-            '스틸컷', '포스터', '예고편', '트레일러', '메이킹',
-            '인터뷰', '토크', '팬미팅', '사인회', '오프라인',
-            '굿즈', '기념품', '포토카드', '포토존', '체험',
-            '이벤트', '행사', '프로모션', '캠페인', '콘서트',
-            '페스티벌', '영화제', '어워드', '시상식', '수상',
-            '특별', '한정', '단독', '독점', '최초', '최고',
-            '블라인드', '미리보기', '시연', '체험관', '전시',
-            '갤러리', '박물관', '아카이브', '컬렉션', '전시회'
-        ]
-        
-        title_lower = title.lower()
-        for keyword in movie_keywords:
-            if keyword in title_lower:
-                return True
+        상세 페이지는 목록과 같은 HTTP 클라이언트(속도 제한, 재시도, 조건부 GET)로 받고,
+        제한된 수의 작업자가 완료되는 순서대로 처리합니다. 내용이 그대로인 이벤트는
+        지난 실행의 추출 결과를 사용합니다.
+        """
+        # 목록 페이지나 사이트 기본 링크는 상세 페이지가 아님
+        listing_links = {adapter.link for adapter in self.adapters.values()}
+        listing_links.update(self._listing_sites)
         
-        return False
-    
-    def extract_image_url(self, element, base_url):
-        """이미지 URL 추출"""
-        # img 태그에서 src 추출
-        img = element.find('img')
-        if img:
-            src = img.get('src') or img.get('data-src')
-            if src:
-                if src.startswith('http'):
-                    return src
-                elif src.startswith('//'):
-                    return 'https:' + src
-                else:
-                    return base_url + src
+        targets = {}
+        for event in self.events:
+            link = event['link']
+            if not link or link in listing_links:
+                continue
+            detail = self.state.detail(link) if self.state else None
+            # 예전 실행에서 저장한 종료일만 있는 결과는 시작일 없이 쓰지 않고 다시 받음
+            if detail is not None and 'end_date' in detail and 'date' not in detail:
+                detail = None
+            if detail is not None and event['id'] not in self._changed_event_ids:
+                event.update(detail)
+                continue
+            targets.setdefault(link, []).append(event)
         
-        # background-image 스타일에서 추출
-        style = element.get('style', '')
-        bg_match = re.search(r'background-image:\s*url\(["\']?([^"\']+)["\']?\)', style)
-        if bg_match:
-            src = bg_match.group(1)
-            if src.startswith('http'):
-                return src
-            elif src.startswith('//'):
-                return 'https:' + src
-            else:
-                return base_url + src
+        if not targets:
+            return
         
-        return None
+        logger.info("상세 페이지에서 기간/장소 추출 중", extra={'count': len(targets)})
+        found = 0
+        workers = self.max_workers if self.concurrent else 1
+        for link, content in stream_details(interleave_hosts(targets), self._download_safely, max_workers=workers,
+                                            max_in_flight=self.max_in_flight or None):
+            site = self.site_for(link)
+            if isinstance(content, Exception):
+                self.metrics.increment('detail_errors', site)
+                logger.warning("상세 페이지 오류", extra={'site': site, 'url': link, 'error': str(content)})
+                continue
+            with self.metrics.timer('detail_parse', site):
+                detail = parse_detail(content, link)
+            if self.state:
+                self.state.set_detail(link, detail)
+            for event in targets[link]:
+                event.update(detail)
+            if detail:
+                found += 1
+                self.metrics.increment('details_found', site)
+        logger.info("상세 페이지 기간/장소 추출 완료", extra={'count': found})
+    
+    def extract_listing(self, url, content, site):
+        """목록 페이지에서 이벤트 레코드 추출 - 프로세스 풀에 미리 넣어둔 작업이 있으면 그 결과 사용"""
+        future = self._extractions.pop(url, None)
+        if future is not None:
+            return future.result()
+        return extract_page(*self._extract_args(url, content, site))
     
-    def crawl_cgv_events(self):
-        """CGV 이벤트 크롤링 - 개선된 버전"""
+    def _extract_args(self, url, content, site):
+        adapter = self.adapters[site]
+        page = self.state.pages.get(url) if self.state else None
+        return (site, content, adapter.container_selectors, adapter.fields, adapter.base_url, None, self.parser,
+                self.scoped, page['fingerprint'] if page else None)
+    
+    def build_event(self, site, record):
+        """추출한 레코드로 이벤트 생성 - 페이지에 없던 값은 사이트 기본값으로 채움"""
+        adapter = self.adapters[site]
+        title = record['title']
+        link = record['link'] or adapter.link
+        event_id = make_event_id(adapter.prefix, adapter.source, link, title)
+        if not record['link']:
+            # 사이트 기본 링크는 이벤트를 구분하지 못하므로 제목이 같아도 중복으로 거르지 않고 목록 순서대로 순번을 붙임
+            occurrence = 1
+            while event_id in self.event_ids:
+                occurrence += 1
+                event_id = make_event_id(adapter.prefix, adapter.source, link, title, occurrence)
+        return {
+            "id": event_id,
+            "title": title,
+            "description": record['description'] or f"{title} - {adapter.source}에서 진행되는 특별한 이벤트입니다.",
+            "date": record['date'] or (datetime.now() + timedelta(days=random.randint(1, 30))).strftime("%Y-%m-%d"),
+            **({"end_date": record['end_date']} if record['date'] and record['end_date'] else {}),
+            "location": record['location'] or random.choice(adapter.locations),
+            "type": random.choice(adapter.types),
+            "genre": random.choice(adapter.genres),
+            # 자리표시 이미지는 이벤트 ID로 정함 - 목록 위치가 바뀌어도 내용 지문이 그대로 유지됨
+            "image": record['image'] or f"https://picsum.photos/300/200?random={event_id}",
+            "source": adapter.source,
+            "link": link,
+            "created_at": datetime.now().isoformat()
+        }
+    
+    def crawl_site(self, site):
+        """사이트의 목록 페이지들에서 이벤트 수집 - 시작 URL부터 다음 페이지를 따라가며 전체 목록 수집
+        
+        페이지마다 다음 페이지 링크(rel="next" 등)와 페이지 번호 쿼리(page_param)로 다음 페이지를 찾고,
+        새 이벤트가 나온 페이지에서만 더 따라갑니다. 본 URL은 다시 받지 않으며 페이지 수와 깊이는
+        max_pages, max_depth로 제한합니다. 동시 모드에서는 찾은 페이지를 바로 미리 받기 시작합니다.
+        """
+        source = self.adapters[site].source
+        frontier = Frontier(max_pages=self.max_pages, max_depth=self.max_depth)
+        for url in self.adapters[site].listing_urls:
+            frontier.add(url)
+        errors = 0
         try:
-            print("CGV 이벤트 크롤링 시작...")
-            
-            # CGV 이벤트 페이지 URL들
-            urls = [
-                "http://www.cgv.co.kr/event/eventList.aspx",
-                "http://www.cgv.co.kr/culture-event/event/"
-            ]
+            logger.info("이벤트 크롤링 시작", extra={'site': site})
             
-            for url in urls:
+            while frontier:
+                url, depth = frontier.pop()
+                before = len(self.events)
                 try:
-                    response = requests.get(url, headers=self.headers, timeout=10)
-                    response.raise_for_status()
-                    soup = BeautifulSoup(response.content, 'html.parser')
-                    
-                    # CGV 이벤트 요소 찾기 - 더 구체적인 선택자
-                    event_elements = (
-                        soup.find_all('div', class_='event_card') or
-                        soup.find_all('div', class_='event-item') or
-                        soup.find_all('li', class_='event-list') or
-                        soup.find_all('div', class_='event') or
-                        soup.find_all('article') or
-                        soup.find_all('a', href=lambda x: x and 'event' in x and 'detail' in x)
-                    )
-                    
-                    print(f"CGV {url}에서 {len(event_elements)}개 이벤트 요소 발견")
-                    
-                    for element in event_elements[:8]:
-                        try:
-                            # 제목 추출 - 다양한 방법 시도
-                            title = ""
-                            title_selectors = [
-                                'h3', 'h2', 'h1', 'strong', 'span.title', 
-                                'div.title', 'p.title', 'a', '.event-title'
-                            ]
-                            
-                            for selector in title_selectors:
-                                title_elem = element.find(selector)
-                                if title_elem:
-                                    title = title_elem.get_text(strip=True)
-                                    if self.clean_title(title) and self.is_movie_related(title):
-                                        break
-                            
-                            # 제목이 없으면 전체 텍스트에서 추출
-                            if not title:
-                                title = element.get_text(strip=True)
-                                # 첫 번째 의미있는 텍스트 추출
-                                lines = [line.strip() for line in title.split('\n') if line.strip()]
-                                for line in lines:
-                                    if self.clean_title(line) and self.is_movie_related(line) and len(line) > 5:
-                                        title = line
-                                        break
-                            
-                            title = self.clean_title(title)
-                            if not title or not self.is_movie_related(title):
-                                continue
-                            
-                            # 이미지 URL 추출
-                            image_url = self.extract_image_url(element, "https://www.cgv.co.kr")
-                            if not image_url:
-                                image_url = f"https://picsum.photos/300/200?random={len(self.events) + 1}"
-                            
-                            # 링크 추출
-                            link_elem = element.find('a')
-                            link = link_elem.get('href') if link_elem else "https://www.cgv.co.kr/event"
-                            if link and not link.startswith('http'):
-                                link = "https://www.cgv.co.kr" + link
-                            
-                            # 날짜 추출 시도
-                            date_elem = element.find('span', class_='date') or element.find('div', class_='date')
-                            if date_elem:
-                                date_text = date_elem.get_text(strip=True)
-                                # 날짜 파싱 로직 (실제로는 더 복잡)
-                                date = (datetime.now() + timedelta(days=random.randint(1, 30))).strftime("%Y-%m-%d")
-                            else:
-                                date = (datetime.now() + timedelta(days=random.randint(1, 30))).strftime("%Y-%m-%d")
-                            
-                            location = random.choice(["CGV 강남", "CGV 잠실", "CGV 홍대", "CGV 신촌", "CGV 부산", "CGV 대구"])
-                            
-                            event = {
-                                "id": f"cgv_{len(self.events) + 1}",
-                                "title": title,
-                                "description": f"{title} - CGV에서 진행되는 특별한 이벤트입니다.",
-                                "date": date,
-                                "location": location,
-                                "type": random.choice(["시사회", "굿즈배포", "프로모션", "체험", "행사"]),
-                                "genre": random.choice(["액션", "로맨스", "드라마", "코미디", "스릴러", "SF", "호러"]),
-                                "image": image_url,
-                                "source": "CGV",
-                                "link": link,
-                                "created_at": datetime.now().isoformat()
-                            }
-                            
-                            self.events.append(event)
-                            print(f"CGV 이벤트 추가: {title}")
-                            
-                        except Exception as e:
-                            print(f"CGV 이벤트 요소 파싱 오류: {e}")
-                            continue
-                    
-                    time.sleep(random.uniform(1, 2))
-                    
+                    links = self.crawl_page(site, url)
                 except Exception as e:
-                    print(f"CGV URL {url} 크롤링 오류: {e}")
+                    # 번호를 올려 요청한 페이지가 없으면 목록 끝
+                    if depth and getattr(getattr(e, 'response', None), 'status_code', None) == 404:
+                        logger.info("다음 페이지 없음", extra={'site': site, 'url': url})
+                        continue
+                    # 일시적인 오류일 수 있으므로 지난번 상태는 유지
+                    self.seen_pages.add(url)
+                    errors += 1
+                    self.metrics.increment('page_errors', site)
+                    logger.error("URL 크롤링 오류", extra={'site': site, 'url': url, 'error': str(e)})
                     continue
-            
-            print(f"CGV에서 {len([e for e in self.events if e['source'] == 'CGV'])}개 이벤트 수집")
+                self.seen_pages.add(url)
+                self.metrics.increment('listing_pages', site)
                 
-        except Exception as e:
-            print(f"CGV 크롤링 전체 오류: {e}")
-    
-    def crawl_megabox_events(self):
-        """메가박스 이벤트 크롤링 - 개선된 버전"""
-        try:
-            print("메가박스 이벤트 크롤링 시작...")
-            
-            # 메가박스 이벤트 페이지 URL
-            url = "https://www.megabox.co.kr/event/curtaincall"
+                # 새 이벤트가 없는 페이지(빈 페이지, 번호를 무시하고 같은 목록을 주는 사이트)에서 중단
+                if len(self.events) > before:
+                    self.schedule_next_pages(frontier, site, url, depth, links)
             
-            try:
-                response = requests.get(url, headers=self.headers, timeout=10)
-                response.raise_for_status()
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # 메가박스 이벤트 요소 찾기
-                event_elements = (
-                    soup.find_all('div', class_='event-item') or
-                    soup.find_all('li', class_='event-list') or
-                    soup.find_all('div', class_='event') or
-                    soup.find_all('article') or
-                    soup.find_all('a', href=lambda x: x and 'event' in x) or
-                    soup.find_all('div', class_='event-slider')
-                )
-                
-                print(f"메가박스에서 {len(event_elements)}개 이벤트 요소 발견")
-                
-                for element in event_elements[:10]:
-                    try:
-                        # 제목 추출
-                        title = ""
-                        title_selectors = [
-                            'h3', 'h2', 'h1', 'strong', 'span.title', 
-                            'div.title', 'p.title', 'a', '.event-title', 'p.name'
-                        ]
-                        
-                        for selector in title_selectors:
-                            title_elem = element.find(selector)
-                            if title_elem:
-                                title = title_elem.get_text(strip=True)
-                                if self.clean_title(title) and self.is_movie_related(title):
-                                    break
-                        
-                        # 제목이 없으면 전체 텍스트에서 추출
-                        if not title:
-                            title = element.get_text(strip=True)
-                            lines = [line.strip() for line in title.split('\n') if line.strip()]
-                            for line in lines:
-                                if self.clean_title(line) and self.is_movie_related(line) and len(line) > 5:
-                                    title = line
-                                    break
-                        
-                        title = self.clean_title(title)
-                        if not title or not self.is_movie_related(title):
-                            continue
-                        
-                        # 이미지 URL 추출
-                        image_url = self.extract_image_url(element, "https://www.megabox.co.kr")
-                        if not image_url:
-                            image_url = f"https://picsum.photos/300/200?random={len(self.events) + 200}"
-                        
-                        # 링크 추출
-                        link_elem = element.find('a')
-                        link = link_elem.get('href') if link_elem else "https://www.megabox.co.kr"
-                        if link and not link.startswith('http'):
-                            link = "https://www.megabox.co.kr" + link
-                        
-                        date = (datetime.now() + timedelta(days=random.randint(1, 30))).strftime("%Y-%m-%d")
-                        location = random.choice(["메가박스 코엑스", "메가박스 강남", "메가박스 홍대", "메가박스 부산", "메가박스 대구"])
-                        
-                        event = {
-                            "id": f"megabox_{len(self.events) + 1}",
-                            "title": title,
-                            "description": f"{title} - 메가박스에서 진행되는 특별한 이벤트입니다.",
-                            "date": date,
-                            "location": location,
-                            "type": random.choice(["시사회", "굿즈배포", "프로모션", "체험", "행사"]),
-                            "genre": random.choice(["액션", "로맨스", "드라마", "코미디", "스릴러", "SF", "호러"]),
-                            "image": image_url,
-                            "source": "메가박스",
-                            "link": link,
-                            "created_at": datetime.now().isoformat()
-                        }
-                        
-                        self.events.append(event)
-                        print(f"메가박스 이벤트 추가: {title}")
-                        
-                    except Exception as e:
-                        print(f"메가박스 이벤트 요소 파싱 오류: {e}")
-                        continue
-                
-                print(f"메가박스에서 {len([e for e in self.events if e['source'] == '메가박스'])}개 이벤트 수집")
-                
-            except Exception as e:
-                print(f"메가박스 크롤링 오류: {e}")
+            if not errors and not frontier.truncated:
+                self.complete_sources.add(source)
+            logger.info("이벤트 수집 완료", extra={'site': site, 'pages': len(frontier.seen),
+                                                 'count': len([e for e in self.events if e['source'] == source])})
                 
         except Exception as e:
-            print(f"메가박스 크롤링 전체 오류: {e}")
+            logger.exception("크롤링 전체 오류", extra={'site': site, 'error': str(e)})
     
-    def crawl_maxmovie_events(self):
-        """MaxMovie 이벤트 크롤링 - 개선된 버전"""
-        try:
-            print("MaxMovie 이벤트 크롤링 시작...")
-            
-            # MaxMovie 이벤트 페이지 URL
-            url = "https://www.maxmovie.com/event"
-            
-            try:
-                response = requests.get(url, headers=self.headers, timeout=10)
-                response.raise_for_status()
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # MaxMovie 이벤트 요소 찾기 - 실제 구조에 맞게 수정
-                event_elements = (
-                    soup.find_all('h3') or
-                    soup.find_all('article', class_='eventWrap') or
-                    soup.find_all('li', class_='EventData__EventDataBlock-sc-1jd0eu4-0') or
-                    soup.find_all('div', class_='event-item') or
-                    soup.find_all('a', href=lambda x: x and 'event' in x)
-                )
-                
-                print(f"MaxMovie에서 {len(event_elements)}개 이벤트 요소 발견")
-                
-                for i, element in enumerate(event_elements[:15]):  # 최대 15개
-                    try:
-                        # 제목 추출 - h3 태그에서 직접 추출
-                        title = ""
-                        if element.name == 'h3':
-                            title = element.get_text(strip=True)
-                        else:
-                            # 다른 요소에서 텍스트 추출
-                            title_elem = element.find('h3') or element
-                            title = title_elem.get_text(strip=True)
-                        
-                        title = self.clean_title(title)
-                        if not title or not self.is_movie_related(title):
-                            continue
-                        
-                        # 설명 추출
-                        desc_elem = element.find('p') or element.find('div', class_='description')
-                        description = desc_elem.get_text(strip=True) if desc_elem else f"{title} - MaxMovie에서 진행되는 특별한 이벤트입니다."
-                        
-                        # 이미지 추출 - 개선된 버전
-                        image_url = self.extract_image_url(element, "https://www.maxmovie.com")
-                        if not image_url:
-                            image_url = f"https://picsum.photos/300/200?random={len(self.events) + 300}"
-                        
-                        # 링크 추출
-                        link_elem = element.find('a')
-                        link = link_elem.get('href') if link_elem else "https://www.maxmovie.com/event"
-                        if link and not link.startswith('http'):
-                            link = f"https://www.maxmovie.com{link}"
-                        
-                        # 날짜 (실제로는 페이지에서 추출해야 함)
-                        date = (datetime.now() + timedelta(days=random.randint(1, 30))).strftime("%Y-%m-%d")
-                        
-                        # 위치 (실제로는 페이지에서 추출해야 함)
-                        location = random.choice(["MaxMovie 온라인", "MaxMovie 앱", "MaxMovie 웹사이트", "전국 영화관"])
-                        
-                        event = {
-                            "id": f"maxmovie_{len(self.events) + 1}",
-                            "title": title,
-                            "description": description,
-                            "date": date,
-                            "location": location,
-                            "type": random.choice(["시사회", "굿즈배포", "프로모션", "체험", "행사", "이벤트"]),
-                            "genre": random.choice(["액션", "로맨스", "드라마", "코미디", "스릴러", "SF", "호러", "애니메이션"]),
-                            "image": image_url,
-                            "source": "MaxMovie",
-                            "link": link,
-                            "created_at": datetime.now().isoformat()
-                        }
-                        
-                        self.events.append(event)
-                        print(f"MaxMovie 이벤트 추가: {title}")
-                        
-                    except Exception as e:
-                        print(f"MaxMovie 이벤트 요소 파싱 오류: {e}")
-                        continue
-                
-                print(f"MaxMovie에서 {len([e for e in self.events if e['source'] == 'MaxMovie'])}개 이벤트 수집")
-                
-            except Exception as e:
-                print(f"MaxMovie 크롤링 오류: {e}")
-                
-        except Exception as e:
-            print(f"MaxMovie 크롤링 전체 오류: {e}")
+    def crawl_page(self, site, url):
+        """목록 페이지 하나에서 이벤트 수집 - 본문에서 찾은 다음 페이지 링크 반환 (304면 빈 목록)"""
+        content = self.fetch_page(url)
+        if content is NOT_MODIFIED:
+            self.reuse_page_events(url)
+            return []
+        links = next_page_links(content, url)
+        
+        # 페이지에 포함된 JSON을 먼저 보고, 없으면 이벤트 요소에서 추출
+        result = self.extract_listing(url, content, site)
+        # 본문은 더 이상 필요 없음 - 다음 페이지를 받는 동안 메모리에 남지 않게 함
+        del content
+        # 추출 단계 시간은 프로세스 풀에서 실행한 경우에도 결과에 담겨 옴
+        for stage, seconds in result['timings'].items():
+            self.metrics.add_time(stage, seconds, site)
+        self.metrics.increment('elements_found', site, result['count'])
+        self.metrics.increment('events_filtered', site, result['filtered'])
+        logger.info("이벤트 발견", extra={'site': site, 'url': url, 'count': result['count'],
+                                         'structured': result['structured']})
+        
+        # 이벤트 컨테이너가 지난번과 같으면 추출 결과 재사용
+        if self.skip_unchanged_page(url, result['fingerprint']):
+            return links
+        
+        for record in result['records']:
+            event = self.build_event(site, record)
+            with self.metrics.timer('dedup', site):
+                added = self.add_event(event)
+            if added:
+                self.metrics.increment('events_added', site)
+                logger.debug("이벤트 추가", extra={'site': site, 'title': event['title']})
+            else:
+                self.metrics.increment('events_duplicate', site)
+        
+        self.remember_events(url)
+        return links
+    
+    def schedule_next_pages(self, frontier, site, url, depth, links):
+        """다음 페이지 후보를 대기열에 넣고 미리 받기 시작
+        
+        페이지 번호 쿼리가 있는 사이트는 링크가 없어도(이벤트 목록 뒤를 받지 않은 경우 등)
+        다음 page_lookahead개 번호를 후보로 넣어 여러 페이지를 동시에 받습니다.
+        """
+        candidates = [(link, depth + 1) for link in links]
+        param = self.adapters[site].page_param
+        if param:
+            page = page_number(url, param)
+            candidates.extend((page_url(url, param, page + step), depth + step)
+                              for step in range(1, max(1, self.page_lookahead) + 1))
+        added = []
+        for candidate, candidate_depth in candidates:
+            if frontier.add(candidate, candidate_depth):
+                self._listing_sites[candidate] = site
+                added.append(candidate)
+        self.prefetch_more(added)
     
     def save_events(self):
-        """이벤트 데이터를 JSON 파일로 저장"""
+        """이벤트 데이터를 JSON 파일로 저장 - 증분 모드면 기존 데이터에 병합"""
+        with self.metrics.timer('export'):
+            self._save_events()
+    
+    def _save_events(self):
         try:
             # public/data 디렉토리가 없으면 생성
-            os.makedirs('public/data', exist_ok=True)
+            os.makedirs(DATA_DIR, exist_ok=True)
+            
+            events = self.merged_events() if self.state or self.partial else self.events
+            # JSON과 CSV(분석용)를 한 번에 스트리밍으로 쓰고 임시 파일 rename으로 교체
+            facets = FacetIndexBuilder()
+            search_index = SearchIndexBuilder()
+            shards = EventShardWriter(DATA_DIR)
+            observers = [facets, search_index, shards]
+            history = None
+            if self.history_format:
+                if columnar_available():
+                    history = ColumnarHistoryWriter(self.history_dir, format=self.history_format)
+                    observers.append(history)
+                else:
+                    logger.warning("pyarrow가 설치되어 있지 않아 컬럼 포맷 이력 저장을 건너뜁니다. (pip install pyarrow)")
+            count = write_events(events, os.path.join(DATA_DIR, 'events.json'), os.path.join(DATA_DIR, 'events.csv'),
+                                 observers=observers)
+            self.metrics.increment('events_exported', value=count)
+            logger.info("events.json/events.csv 저장", extra={'count': count})
+            # 인덱스에 events.json 내용 해시를 기록 - 인덱스 저장이 실패하면 API가 이전 인덱스를 쓰지 않음
+            generation = file_digest(os.path.join(DATA_DIR, 'events.json'))
             
-            with open('public/data/events.json', 'w', encoding='utf-8') as f:
-                json.dump(self.events, f, ensure_ascii=False, indent=2)
-            print(f"총 {len(self.events)}개 이벤트를 events.json에 저장했습니다.")
+            # API 필터링용 패싯 인덱스
+            facets.write(os.path.join(DATA_DIR, 'events-facets.json'), generation)
+            logger.info("패싯 인덱스 저장", extra={'path': 'events-facets.json'})
             
-            # CSV 파일로도 저장 (분석용)
-            df = pd.DataFrame(self.events)
-            df.to_csv('public/data/events.csv', index=False, encoding='utf-8-sig')
-            print("이벤트 데이터를 CSV 파일로도 저장했습니다.")
+            # API 검색용 역색인
+            search_index.write(os.path.join(DATA_DIR, 'events-search.json'), generation)
+            logger.info("검색 인덱스 저장", extra={'path': 'events-search.json'})
+            
+            # 정적 사이트용 날짜순 페이지 파일 - 내용이 바뀐 페이지만 다시 씀
+            written = shards.write()
+            logger.info("페이지 파일 저장", extra={'changed': written, 'path': 'events-manifest.json'})
+            
+            if history:
+                logger.info("분석용 이력 저장", extra={'path': history.write()})
             
         except Exception as e:
-            print(f"파일 저장 오류: {e}")
+            logger.exception("파일 저장 오류", extra={'error': str(e)})
     
     def run(self):
         """크롤링 실행"""
-        print("=" * 50)
-        print("개선된 영화 이벤트 크롤링을 시작합니다...")
-        print("의미없는 텍스트 필터링 강화!")
-        print("=" * 50)
+        logger.info("개선된 영화 이벤트 크롤링을 시작합니다")
+        
+        start_time = time.perf_counter()
         
-        start_time = time.time()
+        if self.state:
+            self.existing_events = self.load_existing_events()
+        elif self.partial:
+            # 실행하지 않는 사이트의 이벤트만 남김 - 실행한 사이트는 이번 결과로 교체
+            sources = {adapter.source for adapter in self.adapters.values()}
+            self.existing_events = {key: event for key, event in self.load_existing_events().items()
+                                    if event['source'] not in sources}
         
-        # 모든 사이트 크롤링 실행
-        self.crawl_cgv_events()
-        self.crawl_megabox_events()
-        self.crawl_maxmovie_events()
+        # HTML 파싱/추출은 CPU 작업이라 여러 프로세스로 나눠서 실행
+        if self.parse_workers:
+            self.parse_pool = ProcessPoolExecutor(max_workers=self.parse_workers)
+        try:
+            # 동시 모드에서는 모든 사이트/URL을 병렬로 받아두고, 결과 반영은 고정된 순서로 진행
+            if self.concurrent:
+                self.prefetch_pages([url for adapter in self.adapters.values() for url in adapter.listing_urls])
+            
+            # 선택한 사이트 크롤링 실행 (어댑터 등록 순서)
+            for site in self.adapters:
+                self.crawl_site(site)
+        finally:
+            self.finish_prefetch()
+            if self.parse_pool:
+                self.parse_pool.shutdown()
+                self.parse_pool = None
+        
+        # 상세 페이지에서 실제 기간/장소 추출
+        if self.details:
+            self.fetch_event_details()
         
         # 데이터 저장
         self.save_events()
         
-        end_time = time.time()
-        print("=" * 50)
-        print(f"크롤링이 완료되었습니다! (소요시간: {end_time - start_time:.2f}초)")
-        print(f"총 {len(self.events)}개의 이벤트를 수집했습니다.")
-        print("=" * 50)
+        if self.state:
+            self.prune_state()
+            self.state.save()
+        if self.cache:
+            self.cache.evict()
+        
+        elapsed = time.perf_counter() - start_time
+        self.metrics.add_time('run', elapsed)
+        self.metrics.increment('http_retries', value=getattr(self.http, 'retries', 0))
+        peak = peak_memory_mb()
+        logger.info("크롤링이 완료되었습니다", extra={'seconds': round(elapsed, 2), 'count': len(self.events),
+                                                'peak_memory_mb': round(peak, 1) if peak is not None else None})
+        if self.metrics_file or self.prometheus_file:
+            self.metrics.write(self.metrics_file, self.prometheus_file)
+            logger.info("메트릭 저장", extra={'path': ', '.join(filter(None, (self.metrics_file,
+                                                                             self.prometheus_file)))})
 
 if __name__ == "__main__":
-    crawler = ImprovedMovieEventCrawler()
+    parser = argparse.ArgumentParser(description="영화 이벤트 크롤러")
+    parser.add_argument('--sites', help=f"크롤링할 사이트 (쉼표로 구분, 기본값: 전체 - {', '.join(site_names())})")
+    parser.add_argument('--sequential', action='store_true', help="사이트를 순차적으로 크롤링")
+    parser.add_argument('--workers', type=int, default=6, help="동시 다운로드 작업 수")
+    parser.add_argument('--rate', type=float, default=0.7, help="호스트별 초당 요청 수")
+    parser.add_argument('--burst', type=int, default=1, help="호스트별 연속 요청 허용 수")
+    parser.add_argument('--pool-size', type=int, default=10, help="호스트당 유지할 HTTP 커넥션 수")
+    parser.add_argument('--parser', choices=PARSERS, help="HTML 파서 백엔드 (기본값: lxml, 없으면 html.parser)")
+    parser.add_argument('--max-page-bytes', type=int, default=MAX_PAGE_BYTES, help="페이지당 최대 응답 크기(바이트)")
+    parser.add_argument('--max-in-flight', type=int, default=0,
+                        help="받아두고 아직 처리하지 않은 페이지 최대 개수 (0이면 제한 없음)")
+    parser.add_argument('--no-early-abort', action='store_true', help="이벤트 목록 이후에도 페이지 끝까지 다운로드")
+    parser.add_argument('--parse-workers', type=int, default=0,
+                        help="HTML 파싱/추출 프로세스 수 (0이면 메인 프로세스에서 추출)")
+    parser.add_argument('--full-parse', action='store_true', help="이벤트 컨테이너만이 아니라 페이지 전체를 파싱")
+    parser.add_argument('--cache-dir', default='.cache/http', help="HTTP 응답 캐시 디렉토리")
+    parser.add_argument('--no-cache', action='store_true', help="조건부 GET 캐시 사용 안 함")
+    parser.add_argument('--state-file', default='.cache/crawl_state.json', help="증분 크롤링 상태 파일")
+    parser.add_argument('--history-format', choices=COLUMNAR_FORMATS,
+                        help="크롤링 날짜별 컬럼 포맷 이력 저장 (pyarrow 필요)")
+    parser.add_argument('--history-dir', default='data/history', help="컬럼 포맷 이력 디렉토리")
+    parser.add_argument('--no-details', action='store_true', help="상세 페이지에서 기간/장소를 추출하지 않음")
+    parser.add_argument('--full-refresh', action='store_true', help="증분 크롤링 없이 전체를 다시 추출하고 덮어쓰기")
+    parser.add_argument('--max-pages', type=int, default=MAX_LISTING_PAGES, help="사이트별 최대 목록 페이지 수")
+    parser.add_argument('--max-depth', type=int, default=MAX_LISTING_DEPTH,
+                        help="시작 URL에서 따라갈 최대 다음 페이지 깊이")
+    parser.add_argument('--page-lookahead', type=int, default=2,
+                        help="처리 중인 페이지 다음으로 미리 요청할 페이지 번호 수")
+    parser.add_argument('--log-level', default='INFO', choices=('DEBUG', 'INFO', 'WARNING', 'ERROR'),
+                        help="로그 레벨 (DEBUG면 이벤트마다 출력)")
+    parser.add_argument('--log-format', default='text', choices=LOG_FORMATS, help="로그 형식")
+    parser.add_argument('--metrics-file', default='.cache/metrics.json', help="단계별 시간/카운터 JSON 파일")
+    parser.add_argument('--prometheus-file', default='.cache/metrics.prom', help="Prometheus 텍스트 형식 메트릭 파일")
+    args = parser.parse_args()
+    
+    try:
+        sites = parse_sites(args.sites) if args.sites else None
+    except ValueError as e:
+        parser.error(str(e))
+    configure_logging(args.log_level, args.log_format)
+    
+    cache = None if args.no_cache else HttpCache(args.cache_dir)
+    state = None if args.full_refresh else CrawlState(args.state_file)
+    crawler = ImprovedMovieEventCrawler(concurrent=not args.sequential, max_workers=args.workers,
+                                        rate=args.rate, burst=args.burst, pool_size=args.pool_size, cache=cache,
+                                        parser=args.parser, scoped=not args.full_parse, state=state,
+                                        history_format=args.history_format, history_dir=args.history_dir,
+                                        details=not args.no_details, parse_workers=args.parse_workers,
+                                        max_page_bytes=args.max_page_bytes, max_in_flight=args.max_in_flight,
+                                        early_abort=not args.no_early_abort, metrics_file=args.metrics_file,
+                                        prometheus_file=args.prometheus_file, max_pages=args.max_pages,
+                                        max_depth=args.max_depth, page_lookahead=args.page_lookahead,
+                                        sites=sites)
     crawler.run() 
\ No newline at end of file
@@ -0,0 +1,96 @@
+import json
+import re
+
+from exporter import atomic_write
+
+# 패싯 인덱스를 만드는 이벤트 필드 (API의 type / genre / source 필터)
+FACET_FIELDS = ('source', 'type', 'genre')
+
+
+class FacetIndexBuilder:
+    """events.json과 함께 쓰는 패싯 인덱스
+
+    이벤트 위치(events.json 배열 인덱스)를 필드 값별 posting list로 모으고, 값별 개수와
+    날짜 내림차순 정렬 순서를 미리 계산합니다. posting list도 날짜 내림차순으로 저장하므로
+    API는 가장 짧은 목록을 나머지 목록과 교집합하기만 하면 정렬된 결과를 얻습니다.
+    """
+
+    def __init__(self, fields=FACET_FIELDS):
+        self.fields = fields
+        self.dates = []
+        self.values = {field: [] for field in fields}
+
+    def add(self, event):
+        """write_events 순서대로 호출 - 호출 순서가 곧 이벤트 위치"""
+        self.dates.append(event.get('date') or '')
+        for field in self.fields:
+            self.values[field].append(event.get(field))
+
+    def build(self):
+        # 정렬은 안정 정렬이라 날짜가 같으면 원래 순서 유지 (API의 Array.sort와 동일)
+        date_order = sorted(range(len(self.dates)), key=self.dates.__getitem__, reverse=True)
+        postings = {field: {} for field in self.fields}
+        for position in date_order:
+            for field in self.fields:
+                value = self.values[field][position]
+                if value:
+                    postings[field].setdefault(value, []).append(position)
+        return {
+            'total': len(self.dates),
+            'dateOrder': date_order,
+            'fields': postings,
+            'counts': {field: {value: len(positions) for value, positions in values.items()}
+                       for field, values in postings.items()}
+        }
+
+    def write(self, path, generation=None):
+        """generation은 함께 쓴 events.json의 내용 해시 (exporter.file_digest) - API는 값이 다르면 인덱스를 쓰지 않음"""
+        with atomic_write(path) as f:
+            json.dump({'generation': generation, **self.build()}, f, ensure_ascii=False, separators=(',', ':'))
+
+
+# 검색 인덱스 토큰 - 한글 연속 구간과 영문/숫자 단어 (API의 tokenize와 같은 규칙)
+_TOKEN_RE = re.compile(r'[가-힣]+|[a-z0-9]+')
+
+# 검색 대상 필드 (API의 search 파라미터와 동일)
+SEARCH_FIELDS = ('title', 'description', 'location')
+
+
+def tokenize(text):
+    """한글은 글자 bigram, 영문/숫자는 단어 단위 토큰으로 분리"""
+    tokens = set()
+    for run in _TOKEN_RE.findall((text or '').lower()):
+        if '가' <= run[0] <= '힣':
+            tokens.update(run[i:i + 2] for i in range(len(run) - 1))
+        else:
+            tokens.add(run)
+    return tokens
+
+
+class SearchIndexBuilder:
+    """제목/설명/위치에 대한 역색인
+
+    토큰별로 이벤트 위치 목록(오름차순)을 저장합니다. API는 검색어를 같은 규칙으로 토큰화해서
+    posting list 교집합으로 후보를 좁힌 뒤, 후보에 대해서만 부분 문자열 일치를 확인합니다.
+    """
+
+    def __init__(self, fields=SEARCH_FIELDS):
+        self.fields = fields
+        self.postings = {}
+        self.total = 0
+
+    def add(self, event):
+        position = self.total
+        tokens = set()
+        for field in self.fields:
+            tokens |= tokenize(event.get(field))
+        for token in tokens:
+            self.postings.setdefault(token, []).append(position)
+        self.total += 1
+
+    def build(self):
+        return {'total': self.total, 'tokens': self.postings}
+
+    def write(self, path, generation=None):
+        with atomic_write(path) as f:
+            json.dump({'generation': generation, **self.build()}, f, ensure_ascii=False, separators=(',', ':'))
@@ -0,0 +1,145 @@
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+# 메트릭 이름 앞에 붙는 접두사 (Prometheus)
+METRIC_PREFIX = 'movday_crawler'
+
+# 로그 레코드의 기본 속성 - 이외의 속성(extra)은 구조화 필드로 출력
+_RESERVED_ATTRS = set(vars(logging.makeLogRecord({}))) | {'message', 'asctime'}
+
+LOG_FORMATS = ('text', 'json')
+
+
+class Metrics:
+    """단계별 타이머와 카운터 - (이름, 사이트) 단위로 모으고 JSON/Prometheus 텍스트로 출력
+
+    타이머는 횟수, 합계, 최댓값(초)을, 카운터는 누적값을 가집니다. site가 None이면 사이트 구분 없는 값입니다.
+    여러 스레드에서 동시에 기록해도 됩니다.
+    """
+
+    def __init__(self):
+        self.timers = {}
+        self.counters = {}
+        self._lock = threading.Lock()
+
+    def add_time(self, stage, seconds, site=None):
+        with self._lock:
+            timer = self.timers.setdefault((stage, site), {'count': 0, 'seconds': 0.0, 'max_seconds': 0.0})
+            timer['count'] += 1
+            timer['seconds'] += seconds
+            timer['max_seconds'] = max(timer['max_seconds'], seconds)
+
+    @contextmanager
+    def timer(self, stage, site=None):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(stage, time.perf_counter() - start, site)
+
+    def increment(self, name, site=None, value=1):
+        with self._lock:
+            self.counters[(name, site)] = self.counters.get((name, site), 0) + value
+
+    def get(self, name, site=None):
+        return self.counters.get((name, site), 0)
+
+    def to_dict(self):
+        """{'timers': {단계: {사이트: 값}}, 'counters': {이름: {사이트: 값}}} - 사이트 구분 없는 값은 '_all'"""
+        with self._lock:
+            timers = {}
+            for (stage, site), timer in sorted(self.timers.items(), key=_sort_key):
+                timers.setdefault(stage, {})[site or '_all'] = dict(timer)
+            counters = {}
+            for (name, site), value in sorted(self.counters.items(), key=_sort_key):
+                counters.setdefault(name, {})[site or '_all'] = value
+        return {'timers': timers, 'counters': counters}
+
+    def to_prometheus(self):
+        """Prometheus 텍스트 노출 형식"""
+        data = self.to_dict()
+        lines = []
+        for suffix, help_text, field in (('stage_seconds_total', "단계별 누적 소요 시간(초)", 'seconds'),
+                                         ('stage_calls_total', "단계별 실행 횟수", 'count'),
+                                         ('stage_max_seconds', "단계별 1회 최대 소요 시간(초)", 'max_seconds')):
+            name = f"{METRIC_PREFIX}_{suffix}"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {'gauge' if suffix.startswith('stage_max') else 'counter'}")
+            for stage, sites in data['timers'].items():
+                for site, timer in sites.items():
+                    lines.append(f"{name}{_labels(stage=stage, site=site)} {_number(timer[field])}")
+        for counter, sites in data['counters'].items():
+            name = f"{METRIC_PREFIX}_{counter}_total"
+            lines.append(f"# TYPE {name} counter")
+            for site, value in sites.items():
+                lines.append(f"{name}{_labels(site=site)} {_number(value)}")
+        return '\n'.join(lines) + '\n'
+
+    def write(self, json_path=None, prometheus_path=None):
+        """JSON과 Prometheus 텍스트 파일로 저장 (경로가 None이면 건너뜀)"""
+        if json_path:
+            os.makedirs(os.path.dirname(json_path) or '.', exist_ok=True)
+            with open(json_path, 'w', encoding='utf-8') as f:
+                json.dump(dict(self.to_dict(), created_at=datetime.now().isoformat()), f, ensure_ascii=False,
+                          indent=2)
+        if prometheus_path:
+            os.makedirs(os.path.dirname(prometheus_path) or '.', exist_ok=True)
+            with open(prometheus_path, 'w', encoding='utf-8') as f:
+                f.write(self.to_prometheus())
+
+
+def _sort_key(item):
+    name, site = item[0]
+    return name, site or ''
+
+
+def _number(value):
+    """Prometheus 값 - 정수 카운터는 그대로, 시간은 float 전체 자릿수 (:g는 6자리에서 잘림)"""
+    if isinstance(value, int):
+        return str(value)
+    return repr(float(value))
+
+
+def _labels(**labels):
+    pairs = [f'{key}="{value}"' for key, value in labels.items() if value != '_all']
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+class StructuredFormatter(logging.Formatter):
+    """extra로 넘긴 필드를 함께 출력하는 포매터 - text는 'key=value', json은 한 줄짜리 JSON 객체"""
+
+    def __init__(self, format='text'):
+        super().__init__('%(asctime)s %(levelname)-7s %(message)s', datefmt='%H:%M:%S')
+        if format not in LOG_FORMATS:
+            raise ValueError(f"지원하지 않는 로그 형식: {format}")
+        self.format_name = format
+
+    def format(self, record):
+        fields = {key: value for key, value in vars(record).items() if key not in _RESERVED_ATTRS}
+        if self.format_name == 'json':
+            entry = {'time': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+                     'level': record.levelname, 'logger': record.name, 'message': record.getMessage()}
+            entry.update(fields)
+            if record.exc_info:
+                entry['exception'] = self.formatException(record.exc_info)
+            return json.dumps(entry, ensure_ascii=False, default=str)
+        line = super().format(record)
+        if fields:
+            line += ' ' + ' '.join(f"{key}={value}" for key, value in fields.items())
+        return line
+
+
+def configure_logging(level='INFO', format='text', stream=None):
+    """크롤러 로그 설정 - 표준 에러로 레벨 이상의 로그를 출력"""
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(StructuredFormatter(format))
+    root = logging.getLogger()
+    for existing in list(root.handlers):
+        root.removeHandler(existing)
+    root.addHandler(handler)
+    root.setLevel(level.upper() if isinstance(level, str) else level)
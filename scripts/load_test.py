@@ -0,0 +1,99 @@
+# 로컬 대역 서버(standin_server.py)에 크롤러 전체 실행을 반복해서 동시성 설정별 성능 비교
+# 실제 사이트에는 요청하지 않으며, 결과(실행 시간, 처리량, 재시도 횟수)를 표와 JSON 파일(기본값: .cache/)로 남깁니다.
+import argparse
+import json
+import os
+import tempfile
+import time
+from datetime import datetime
+
+from http_client import HttpClient
+from improved_crawler_v2 import ImprovedMovieEventCrawler
+from instrumentation import configure_logging
+from rate_limiter import HostRateLimiter
+from standin_server import StandInServer
+
+
+def run_crawl(server, workers, rate, burst, details=True, max_in_flight=0, page_lookahead=2):
+    """대역 서버를 대상으로 크롤러를 한 번 실행하고 측정값 반환 - 출력 파일은 임시 디렉토리에 씀"""
+    server.reset_stats()
+    http = HttpClient(pool_maxsize=max(10, workers), rate_limiter=HostRateLimiter(rate=rate, burst=burst),
+                      host_overrides=server.host_overrides())
+    crawler = ImprovedMovieEventCrawler(max_workers=workers, http=http, details=details,
+                                        max_in_flight=max_in_flight, page_lookahead=page_lookahead)
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            start = time.perf_counter()
+            crawler.run()
+            wall = time.perf_counter() - start
+        finally:
+            os.chdir(cwd)
+            http.close()
+
+    stats = dict(server.stats)
+    requests = stats.get('requests', 0)
+    return {
+        'workers': workers,
+        'wall_seconds': wall,
+        'requests': requests,
+        'ok': stats.get(200, 0),
+        'errors': stats.get(500, 0),
+        'throttled': stats.get(429, 0),
+        'not_found': stats.get(404, 0),
+        'retries': http.retries,
+        'events': len(crawler.events),
+        'requests_per_sec': requests / wall if wall else None,
+        'events_per_sec': len(crawler.events) / wall if wall else None,
+        # 크롤러가 기록한 사이트별 단계 시간/카운터
+        'metrics': crawler.metrics.to_dict()
+    }
+
+
+def print_report(results):
+    print(f"{'작업자':>6} {'시간(초)':>9} {'요청':>6} {'요청/초':>8} {'이벤트':>6} {'이벤트/초':>9} "
+          f"{'재시도':>6} {'500':>5} {'429':>5}")
+    for r in results:
+        print(f"{r['workers']:>6} {r['wall_seconds']:>9.2f} {r['requests']:>6} {r['requests_per_sec']:>8.1f} "
+              f"{r['events']:>6} {r['events_per_sec']:>9.1f} {r['retries']:>6} {r['errors']:>5} {r['throttled']:>5}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="로컬 대역 서버를 대상으로 한 크롤링 부하 테스트")
+    parser.add_argument('--workers', default='1,3,6', help="비교할 동시 다운로드 작업 수 (쉼표로 구분)")
+    parser.add_argument('--rate', type=float, default=20.0, help="호스트별 초당 요청 수")
+    parser.add_argument('--burst', type=int, default=5, help="호스트별 연속 요청 허용 수")
+    parser.add_argument('--max-in-flight', type=int, default=0, help="받아두고 처리하지 않은 페이지 최대 개수")
+    parser.add_argument('--latency', type=float, default=0.2, help="응답 지연(초)")
+    parser.add_argument('--jitter', type=float, default=0.1, help="추가 지연 최대값(초)")
+    parser.add_argument('--error-rate', type=float, default=0.05, help="500 오류 응답 비율")
+    parser.add_argument('--throttle-rate', type=float, default=0.02, help="429 응답 비율")
+    parser.add_argument('--retry-after', type=int, default=1, help="429 응답의 Retry-After(초)")
+    parser.add_argument('--pages', type=int, default=1, help="사이트별 목록 페이지 수")
+    parser.add_argument('--page-lookahead', type=int, default=2, help="미리 요청할 다음 페이지 번호 수")
+    parser.add_argument('--seed', type=int, default=0, help="오류/지연 난수 시드")
+    parser.add_argument('--no-details', action='store_true', help="상세 페이지 단계 제외")
+    parser.add_argument('--verbose', action='store_true', help="크롤러 로그 표시")
+    parser.add_argument('--output', default='.cache/load-test-results.json', help="결과를 저장할 JSON 파일")
+    args = parser.parse_args()
+
+    configure_logging('INFO' if args.verbose else 'ERROR')
+    settings = {key: value for key, value in vars(args).items() if key not in ('verbose', 'output')}
+    results = []
+    with StandInServer(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                       throttle_rate=args.throttle_rate, retry_after=args.retry_after, pages=args.pages,
+                       seed=args.seed) as server:
+        print(f"대역 서버: {server.url}")
+        for workers in [int(w) for w in args.workers.split(',')]:
+            results.append(run_crawl(server, workers, args.rate, args.burst, details=not args.no_details,
+                                     max_in_flight=args.max_in_flight, page_lookahead=args.page_lookahead))
+            print(f"작업자 {workers}개: {results[-1]['wall_seconds']:.2f}초")
+
+    print()
+    print_report(results)
+    os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump({'created_at': datetime.now().isoformat(), 'settings': settings, 'results': results},
+                  f, ensure_ascii=False, indent=2)
+    print(f"\n결과를 {args.output}에 저장했습니다.")
@@ -0,0 +1,114 @@
+import codecs
+from html.parser import HTMLParser
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from selector_engine import matches_selector
+
+try:
+    import lxml  # noqa: F401
+    DEFAULT_PARSER = 'lxml'
+except ImportError:
+    DEFAULT_PARSER = 'html.parser'
+
+# 지원하는 파서 백엔드 - 추출 코드가 BeautifulSoup API를 쓰므로 bs4 트리 빌더만 허용
+PARSERS = ('lxml', 'html.parser')
+
+# 닫는 태그가 없는 요소
+VOID_ELEMENTS = frozenset(['area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'param',
+                           'source', 'track', 'wbr'])
+
+
+class ScopeStrainer(SoupStrainer):
+    """이벤트 컨테이너 선택자와 일치하는 요소(와 그 하위 트리)만 파싱하는 strainer"""
+
+    def __init__(self, selectors):
+        super().__init__()
+        self.selectors = tuple(selectors)
+
+    def _matches(self, name, attrs):
+        if not isinstance(attrs, dict):
+            attrs = dict(attrs or [])
+        return any(matches_selector(name, attrs, selector) for selector in self.selectors)
+
+    # bs4 4.13 이상
+    def allow_tag_creation(self, nsprefix, name, attrs):
+        return self._matches(name, attrs)
+
+    def allow_string_creation(self, string):
+        return False
+
+    # bs4 4.12 이하
+    def search_tag(self, markup_name=None, markup_attrs={}):
+        markup = markup_name
+        if hasattr(markup, 'name'):
+            markup_name, markup_attrs = markup.name, markup.attrs
+        return markup if self._matches(markup_name, markup_attrs) else None
+
+
+def parse_html(content, scope=None, parser=None):
+    """HTML 파싱 - scope(선택자 목록)가 있으면 해당 컨테이너 하위 트리만 만듦
+
+    전체 DOM 대신 이벤트 목록 부분만 만들기 때문에 파싱 시간과 메모리가 크게 줄어듭니다.
+    scope의 선택자로 찾은 요소와 그 하위 요소는 전체 파싱과 같은 구조로 유지되므로
+    기존 find/find_all 기반 추출 코드를 그대로 사용할 수 있습니다.
+    """
+    parser = parser or DEFAULT_PARSER
+    if parser not in PARSERS:
+        raise ValueError(f"지원하지 않는 파서: {parser}")
+    parse_only = ScopeStrainer(scope) if scope else None
+    return BeautifulSoup(content, parser, parse_only=parse_only)
+
+
+class ContainerWatcher(HTMLParser):
+    """스트리밍 다운로드 중 이벤트 목록이 끝났는지 확인하는 증분 파서
+
+    선택자와 일치한 요소들의 가장 가까운 공통 조상(이벤트 목록)이 닫히면 finished가 됩니다.
+    항목마다 감싸는 요소(li 등)가 있어도 목록 전체가 닫힐 때까지 기다리도록 두 번째 일치부터 판단합니다.
+    트리는 만들지 않고 열린 태그 이름만 추적하므로, 청크를 받는 대로 넣어도 비용이 거의 없습니다.
+    일치하는 요소가 두 개 미만이면 끝까지 finished가 되지 않습니다 (페이지 전체 다운로드).
+    """
+
+    def __init__(self, selectors):
+        super().__init__(convert_charrefs=False)
+        self.selectors = tuple(selectors)
+        self.finished = False
+        self._decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        # 열린 태그 (이름, 일련번호) - 일련번호로 같은 이름의 다른 요소와 구분
+        self._stack = []
+        self._serial = 0
+        self._matches = 0
+        # 지금까지 일치한 요소들의 공통 조상 경로 (일련번호 목록)
+        self._common = None
+
+    def feed_bytes(self, chunk):
+        """응답 청크를 넣고 이벤트 목록이 닫혔으면 True 반환 (HttpClient.get의 stop_reading)"""
+        if not self.finished:
+            self.feed(self._decoder.decode(chunk))
+        return self.finished
+
+    def handle_starttag(self, tag, attrs):
+        if self.finished or tag in VOID_ELEMENTS:
+            return
+        attrs = dict(attrs)
+        if any(matches_selector(tag, attrs, selector) for selector in self.selectors):
+            path = [serial for _, serial in self._stack]
+            if self._common is None:
+                self._common = path
+            else:
+                common = 0
+                while common < min(len(path), len(self._common)) and path[common] == self._common[common]:
+                    common += 1
+                del self._common[common:]
+            self._matches += 1
+        self._serial += 1
+        self._stack.append((tag, self._serial))
+
+    def handle_endtag(self, tag):
+        if self.finished or not any(name == tag for name, _ in self._stack):
+            return
+        # 닫히지 않은 하위 태그(li, p 등)는 함께 닫음
+        while self._stack.pop()[0] != tag:
+            pass
+        if self._matches >= 2 and len(self._stack) < len(self._common):
+            self.finished = True
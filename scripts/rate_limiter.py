@@ -0,0 +1,97 @@
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+
+def parse_retry_after(value):
+    """Retry-After 헤더 값(초 또는 HTTP 날짜)을 초 단위로 변환"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucket:
+    """토큰 버킷 - 초당 rate개씩 채워지고 최대 burst개까지 모임"""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        # 429/503으로 줄어든 rate를 복구할 때의 상한
+        self.max_rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.lock = threading.Lock()
+
+    def _reserve(self):
+        """토큰 하나를 예약하고 기다려야 할 시간을 반환 (먼저 온 요청이 먼저 나감)"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            return max(wait, self.blocked_until - now)
+
+    def acquire(self):
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+
+class HostRateLimiter:
+    """호스트별 토큰 버킷 요청 제한기
+
+    호스트마다 버킷이 따로 있어서 한 호스트를 기다리는 동안 다른 호스트 요청은 막지 않습니다.
+    429/503 응답을 받으면 해당 호스트의 속도를 절반으로 줄이고 Retry-After 동안 요청을 멈추며,
+    정상 응답이 이어지면 설정한 속도까지 조금씩 되돌립니다.
+    """
+
+    def __init__(self, rate=1.0, burst=2, min_rate=0.1, recovery=0.1, host_rates=None):
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.recovery = recovery
+        # 호스트별 (rate, burst) 개별 설정
+        self.host_rates = host_rates or {}
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, url):
+        host = urlparse(url).netloc
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                rate, burst = self.host_rates.get(host, (self.rate, self.burst))
+                bucket = self._buckets[host] = TokenBucket(rate, burst)
+            return bucket
+
+    def acquire(self, url):
+        """해당 호스트에 요청을 보내도 될 때까지 대기"""
+        self.bucket(url).acquire()
+
+    def penalize(self, url, retry_after=None):
+        """429/503 응답 - 속도를 줄이고 Retry-After 동안 요청 중지"""
+        bucket = self.bucket(url)
+        with bucket.lock:
+            bucket.rate = max(self.min_rate, bucket.rate / 2)
+            if retry_after:
+                bucket.blocked_until = max(bucket.blocked_until, time.monotonic() + retry_after)
+
+    def reward(self, url):
+        """정상 응답 - 줄였던 속도를 조금씩 복구"""
+        bucket = self.bucket(url)
+        with bucket.lock:
+            if bucket.rate < bucket.max_rate:
+                bucket.rate = min(bucket.max_rate, bucket.rate + self.recovery)
@@ -0,0 +1,87 @@
+import re
+from functools import lru_cache
+
+from bs4 import Tag
+
+_SELECTOR_RE = re.compile(r'^(?P<tag>[\w-]*)(?P<classes>(?:\.[\w-]+)*)(?P<hrefs>(?:\[href\*=[^\]]+\])*)$')
+
+
+@lru_cache(maxsize=None)
+def parse_selector(selector):
+    """간단한 선택자 문자열을 (태그, 클래스 목록, href 포함 문자열 목록)으로 변환
+
+    지원 형식: 'h3', 'div.event-item', '.event-title', 'a[href*=event][href*=detail]'
+    """
+    match = _SELECTOR_RE.match(selector.strip())
+    if not match:
+        raise ValueError(f"지원하지 않는 선택자: {selector}")
+    classes = tuple(c for c in match.group('classes').split('.') if c)
+    hrefs = tuple(re.findall(r'\[href\*=([^\]]+)\]', match.group('hrefs')))
+    return match.group('tag') or None, classes, hrefs
+
+
+def _matches(parsed, name, attrs):
+    tag, classes, hrefs = parsed
+    if tag and name != tag:
+        return False
+    if classes:
+        value = attrs.get('class') or ''
+        if isinstance(value, str):
+            tokens = value.split()
+            if not (all(c in tokens for c in classes) or (len(classes) == 1 and value == classes[0])):
+                return False
+        elif not all(c in value for c in classes):
+            return False
+    if hrefs:
+        href = attrs.get('href') or ''
+        if not all(h in href for h in hrefs):
+            return False
+    return True
+
+
+def matches_selector(name, attrs, selector):
+    """태그 이름과 속성이 선택자와 일치하는지 확인 (find_all의 class_ 매칭 규칙과 동일)"""
+    return _matches(parse_selector(selector), name, attrs)
+
+
+def select_fallback(root, selectors):
+    """순서가 있는 대체 선택자 목록을 한 번의 트리 순회로 평가
+
+    `root.find_all(s1) or root.find_all(s2) or ...`와 같은 결과(가장 앞선 선택자의 일치 요소들,
+    문서 순서)를 반환하지만, 앞 선택자가 없을 때 문서를 여러 번 다시 순회하지 않습니다.
+    """
+    parsed = [parse_selector(selector) for selector in selectors]
+    best = len(parsed)
+    matches = []
+    for element in root.descendants:
+        if not isinstance(element, Tag):
+            continue
+        # 지금까지 찾은 것보다 우선순위가 같거나 높은 선택자만 검사
+        for i in range(min(best + 1, len(parsed))):
+            if _matches(parsed[i], element.name, element.attrs):
+                if i < best:
+                    best = i
+                    matches = [element]
+                else:
+                    matches.append(element)
+                break
+    return matches
+
+
+def first_matches(element, selectors):
+    """요소의 하위 트리를 한 번 순회하며 선택자별 첫 번째 일치 요소를 찾음 (element.find와 동일)
+
+    반환값: {선택자: 요소} - 일치하는 요소가 없는 선택자는 포함하지 않음
+    """
+    pending = {selector: parse_selector(selector) for selector in selectors}
+    found = {}
+    for child in element.descendants:
+        if not isinstance(child, Tag):
+            continue
+        for selector, parsed in list(pending.items()):
+            if _matches(parsed, child.name, child.attrs):
+                found[selector] = child
+                del pending[selector]
+        if not pending:
+            break
+    return found
@@ -0,0 +1,69 @@
+import importlib
+
+# 사이트 이름 -> 어댑터 모듈 (실행할 사이트의 모듈만 불러옴)
+SITE_MODULES = {
+    'cgv': 'sites.cgv',
+    'megabox': 'sites.megabox',
+    'maxmovie': 'sites.maxmovie'
+}
+
+
+class SiteAdapter:
+    """사이트 하나의 크롤링 설정 - 크롤러 엔진(ImprovedMovieEventCrawler)이 이 값만으로 사이트를 처리
+
+    listing_urls: 목록 시작 URL, container_selectors: 이벤트 요소 선택자 (우선순위 순)
+    fields: 이벤트 요소 안의 필드 선택자 - {'title': [...], 'title_mode': 'search' 또는 'element',
+            'date': [...], 'description': [...], 'link_parent': 이벤트 요소를 감싼 링크의 선택자}
+            (extractors.extract_record 참고)
+    page_param: 목록 페이지 번호 쿼리 이름
+    early_abort: 이벤트 목록이 끝나면 다운로드 중단 - 목록 뒤의 내용(구조화 데이터 JSON, 다음 페이지 링크)은
+                 받지 않음. 목록은 처음 두 이벤트 요소의 공통 조상이므로, 카테고리별 목록처럼 이벤트가 형제 목록
+                 여러 개에 나뉘어 있으면 첫 번째 목록 뒤의 이벤트도 잘림. 목록 뒤에 이벤트 JSON이 없고,
+                 이벤트가 목록 하나에 모여 있고, 다음 페이지를 page_param으로 찾을 수 있는 사이트만 켬
+    rate/burst: 이 사이트 호스트의 요청 속도 제한 (None이면 크롤러 기본값)
+    locations/types/genres: 페이지에 없는 값을 채울 때 쓰는 기본값
+    """
+
+    def __init__(self, name, source, prefix, base_url, link, listing_urls, container_selectors, fields,
+                 page_param=None, early_abort=False, rate=None, burst=None,
+                 locations=(), types=(), genres=()):
+        self.name = name
+        self.source = source
+        self.prefix = prefix
+        self.base_url = base_url
+        self.link = link
+        self.listing_urls = list(listing_urls)
+        self.container_selectors = list(container_selectors)
+        self.fields = fields
+        self.page_param = page_param
+        self.early_abort = early_abort
+        self.rate = rate
+        self.burst = burst
+        self.locations = list(locations)
+        self.types = list(types)
+        self.genres = list(genres)
+
+
+def site_names():
+    return list(SITE_MODULES)
+
+
+def load_adapter(name):
+    """사이트 어댑터 - 처음 요청할 때 해당 모듈만 import"""
+    if name not in SITE_MODULES:
+        raise ValueError(f"알 수 없는 사이트: {name} (사용 가능: {', '.join(SITE_MODULES)})")
+    return importlib.import_module(SITE_MODULES[name]).ADAPTER
+
+
+def load_adapters(names=None):
+    """{사이트 이름: 어댑터} - names가 None이면 등록된 모든 사이트 (등록 순서 유지)"""
+    return {name: load_adapter(name) for name in (names or SITE_MODULES)}
+
+
+def parse_sites(value):
+    """'cgv,maxmovie' 형태의 사이트 목록 - 알 수 없는 이름이면 ValueError"""
+    names = [name.strip() for name in value.split(',') if name.strip()]
+    unknown = [name for name in names if name not in SITE_MODULES]
+    if unknown:
+        raise ValueError(f"알 수 없는 사이트: {', '.join(unknown)} (사용 가능: {', '.join(SITE_MODULES)})")
+    return list(dict.fromkeys(names))
@@ -0,0 +1,27 @@
+from sites import SiteAdapter
+
+ADAPTER = SiteAdapter(
+    name='cgv',
+    source='CGV',
+    prefix='cgv',
+    base_url="https://www.cgv.co.kr",
+    link="https://www.cgv.co.kr/event",
+    listing_urls=[
+        "http://www.cgv.co.kr/event/eventList.aspx",
+        "http://www.cgv.co.kr/culture-event/event/"
+    ],
+    container_selectors=['div.event_card', 'div.event-item', 'li.event-list', 'div.event', 'article',
+                         'a[href*=event][href*=detail]'],
+    fields={
+        'title': ['h3', 'h2', 'h1', 'strong', 'span.title', 'div.title', 'p.title', 'a', '.event-title'],
+        # 기간이면 시작일과 종료일
+        'date': ['span.date', 'div.date']
+    },
+    page_param='page',
+    # 목록 뒤에 이벤트 JSON이 없고 다음 페이지는 page_param으로 찾으므로 목록이 닫히면 다운로드 중단
+    # (목록 뒤의 다음 페이지 링크와 스크립트는 받지 않음 - 사이트가 목록 뒤에 이벤트 JSON을 넣으면 끌 것)
+    early_abort=True,
+    locations=["CGV 강남", "CGV 잠실", "CGV 홍대", "CGV 신촌", "CGV 부산", "CGV 대구"],
+    types=["시사회", "굿즈배포", "프로모션", "체험", "행사"],
+    genres=["액션", "로맨스", "드라마", "코미디", "스릴러", "SF", "호러"]
+)
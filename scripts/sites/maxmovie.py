@@ -0,0 +1,26 @@
+from sites import SiteAdapter
+
+ADAPTER = SiteAdapter(
+    name='maxmovie',
+    source='MaxMovie',
+    prefix='maxmovie',
+    base_url="https://www.maxmovie.com",
+    link="https://www.maxmovie.com/event",
+    listing_urls=[
+        "https://www.maxmovie.com/event"
+    ],
+    container_selectors=['h3', 'article.eventWrap', 'li.EventData__EventDataBlock-sc-1jd0eu4-0', 'div.event-item',
+                         'a[href*=event]'],
+    fields={
+        # 이벤트 요소가 h3 자체이거나 하위 h3의 텍스트가 제목 (없으면 요소 전체 텍스트)
+        'title': ['h3'],
+        'title_mode': 'element',
+        'description': ['p', 'div.description']
+    },
+    page_param='page',
+    # 이벤트 JSON(__NEXT_DATA__)이 목록 뒤에 있으므로 끝까지 받음
+    early_abort=False,
+    locations=["MaxMovie 온라인", "MaxMovie 앱", "MaxMovie 웹사이트", "전국 영화관"],
+    types=["시사회", "굿즈배포", "프로모션", "체험", "행사", "이벤트"],
+    genres=["액션", "로맨스", "드라마", "코미디", "스릴러", "SF", "호러", "애니메이션"]
+)
@@ -0,0 +1,29 @@
+from sites import SiteAdapter
+
+ADAPTER = SiteAdapter(
+    name='megabox',
+    source='메가박스',
+    prefix='megabox',
+    base_url="https://www.megabox.co.kr",
+    link="https://www.megabox.co.kr",
+    listing_urls=[
+        "https://www.megabox.co.kr/event/curtaincall"
+    ],
+    container_selectors=['div.event-item', 'li.event-list', 'div.event', 'article', 'a[href*=event]',
+                         'div.event-slider'],
+    fields={
+        'title': ['h3', 'h2', 'h1', 'strong', 'span.title', 'div.title', 'p.title', 'a', '.event-title',
+                  'p.name'],
+        # 기간이면 시작일과 종료일
+        'date': ['p.date'],
+        # 이벤트 카드(div.event-item)를 상세 페이지 링크가 감싸고 있음
+        'link_parent': 'a[href*=eventNo]'
+    },
+    page_param='page',
+    # 목록 뒤에 이벤트 JSON이 없고 다음 페이지는 page_param으로 찾으므로 목록이 닫히면 다운로드 중단
+    # (목록 뒤의 다음 페이지 링크와 스크립트는 받지 않음 - 사이트가 목록 뒤에 이벤트 JSON을 넣으면 끌 것)
+    early_abort=True,
+    locations=["메가박스 코엑스", "메가박스 강남", "메가박스 홍대", "메가박스 부산", "메가박스 대구"],
+    types=["시사회", "굿즈배포", "프로모션", "체험", "행사"],
+    genres=["액션", "로맨스", "드라마", "코미디", "스릴러", "SF", "호러"]
+)
@@ -0,0 +1,201 @@
+import argparse
+import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+# 대역 서버가 대신 응답하는 호스트와 픽스처 디렉토리 이름
+SITE_HOSTS = {
+    'www.cgv.co.kr': 'cgv',
+    'www.megabox.co.kr': 'megabox',
+    'www.maxmovie.com': 'maxmovie',
+    'www.lottecinema.co.kr': 'lotte'
+}
+
+# 크롤러들이 요청하는 목록 페이지 경로 - 나머지 경로는 상세 페이지로 응답
+LISTING_PATHS = {
+    'cgv': ('/event/eventList.aspx', '/culture-event/event/'),
+    'megabox': ('/event/curtaincall',),
+    'maxmovie': ('/event',),
+    'lotte': ('/NLCHS/Event',)
+}
+
+# 2페이지부터 이벤트 링크를 페이지마다 다르게 바꿀 때 사용 (HTML href, JSON linkUrl)
+_EVENT_LINK_RE = re.compile(r'((?:href=|"linkUrl":\s*)")(/[^"#]*[Ee]vent[^"#]*)"')
+
+
+class _QuietHTTPServer(ThreadingHTTPServer):
+    """클라이언트가 먼저 끊은 연결(다운로드 조기 중단 등)은 오류로 출력하지 않음"""
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class StandInServer:
+    """실제 극장 사이트 대신 픽스처 페이지를 돌려주는 로컬 HTTP 서버 (부하 테스트용)
+
+    Host 헤더로 사이트를 구분하므로 HttpClient(host_overrides=server.host_overrides())로
+    크롤러의 URL을 바꾸지 않고 그대로 이 서버에 보낼 수 있습니다.
+    응답 지연(latency + 0~jitter초), 500 오류 비율(error_rate), 429 비율(throttle_rate, Retry-After 포함),
+    목록 페이지 수(pages, ?page=N과 다음 페이지 링크)를 설정할 수 있습니다.
+    """
+
+    def __init__(self, host='127.0.0.1', port=0, latency=0.0, jitter=0.0, error_rate=0.0, throttle_rate=0.0,
+                 retry_after=1, pages=1, seed=None, fixture_dir=FIXTURE_DIR):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.pages = pages
+        self.fixture_dir = fixture_dir
+        self.random = random.Random(seed)
+        self.stats = Counter()
+        self._lock = threading.Lock()
+        self._fixtures = {}
+        self.httpd = _QuietHTTPServer((host, port), _make_handler(self))
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def host_overrides(self):
+        """HttpClient에 넘길 {실제 호스트: 대역 서버 주소}"""
+        return {host: self.url for host in SITE_HOSTS}
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def reset_stats(self):
+        with self._lock:
+            self.stats.clear()
+
+    def count(self, key):
+        with self._lock:
+            self.stats[key] += 1
+
+    def fixture(self, site, name):
+        """픽스처 본문 (처음 읽은 뒤 메모리에 보관) - 없으면 None"""
+        key = (site, name)
+        if key not in self._fixtures:
+            path = os.path.join(self.fixture_dir, site, name)
+            try:
+                with open(path, 'rb') as f:
+                    self._fixtures[key] = f.read()
+            except OSError:
+                self._fixtures[key] = None
+        return self._fixtures[key]
+
+    def draw(self):
+        """요청 하나의 (지연 시간, 응답 종류) - 'error', 'throttle' 또는 None"""
+        with self._lock:
+            delay = self.latency + (self.random.uniform(0, self.jitter) if self.jitter else 0.0)
+            roll = self.random.random()
+        if roll < self.error_rate:
+            return delay, 'error'
+        if roll < self.error_rate + self.throttle_rate:
+            return delay, 'throttle'
+        return delay, None
+
+    def listing_page(self, site, path, page):
+        """목록 페이지 N - 2페이지부터는 이벤트 링크에 페이지 번호를 붙이고, 마지막이 아니면 다음 페이지 링크 추가"""
+        body = self.fixture(site, 'listing.html')
+        if body is None or page > self.pages:
+            return None
+        html = body.decode('utf-8')
+        if page > 1:
+            html = _EVENT_LINK_RE.sub(
+                lambda m: f'{m.group(1)}{m.group(2)}{"&" if "?" in m.group(2) else "?"}pg={page}"', html)
+        if page < self.pages:
+            html = html.replace('</body>', f'<div class="paging"><a class="next" rel="next" '
+                                          f'href="{path}?page={page + 1}">다음</a></div></body>')
+        return html.encode('utf-8')
+
+
+def _make_handler(server):
+    class StandInHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, format, *args):
+            pass
+
+        def _send(self, status, body=b'', headers=None):
+            self.send_response(status)
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            server.count(status)
+
+        def do_GET(self):
+            server.count('requests')
+            delay, outcome = server.draw()
+            if delay:
+                time.sleep(delay)
+            if outcome == 'error':
+                return self._send(500)
+            if outcome == 'throttle':
+                return self._send(429, headers={'Retry-After': str(server.retry_after)})
+
+            site = SITE_HOSTS.get(self.headers.get('Host', '').split(':')[0])
+            parts = urlsplit(self.path)
+            if site is None:
+                return self._send(404)
+            if parts.path in LISTING_PATHS[site]:
+                page = parse_qs(parts.query).get('page', ['1'])[0]
+                body = server.listing_page(site, parts.path, int(page) if page.isdigit() else 1)
+            else:
+                body = server.fixture(site, 'detail.html')
+            if body is None:
+                return self._send(404)
+            self._send(200, body, {'Content-Type': 'text/html; charset=utf-8'})
+
+    return StandInHandler
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="극장 사이트 대역 서버 (픽스처 응답)")
+    parser.add_argument('--port', type=int, default=8765, help="포트")
+    parser.add_argument('--latency', type=float, default=0.0, help="응답 지연(초)")
+    parser.add_argument('--jitter', type=float, default=0.0, help="추가 지연 최대값(초, 0~jitter 균등 분포)")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="500 오류 응답 비율")
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help="429 응답 비율")
+    parser.add_argument('--retry-after', type=int, default=1, help="429 응답의 Retry-After(초)")
+    parser.add_argument('--pages', type=int, default=1, help="사이트별 목록 페이지 수")
+    parser.add_argument('--seed', type=int, help="오류/지연 난수 시드")
+    args = parser.parse_args()
+
+    server = StandInServer(port=args.port, latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                           throttle_rate=args.throttle_rate, retry_after=args.retry_after, pages=args.pages,
+                           seed=args.seed)
+    print(f"대역 서버 실행 중: {server.url} (호스트: {', '.join(SITE_HOSTS)})")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
@@ -0,0 +1,140 @@
+import json
+import re
+from datetime import datetime, timezone
+from urllib.parse import urljoin
+
+from date_parser import parse_date_range
+
+# <script> 태그 (속성, 내용)
+_SCRIPT_RE = re.compile(r'<script\b([^>]*)>(.*?)</script\s*>', re.S | re.I)
+
+# 인라인 상태 객체 - window.__INITIAL_STATE__ = {...}; 형태
+_INLINE_STATE_RE = re.compile(
+    r'(?:window\.)?(__INITIAL_STATE__|__PRELOADED_STATE__|__APOLLO_STATE__|__NUXT__|__STATE__)\s*=\s*')
+
+# 이벤트 필드별 후보 키 (앞에 있을수록 우선)
+TITLE_KEYS = ('title', 'eventTitle', 'eventName', 'eventNm', 'evntNm', 'name', 'subject')
+DESCRIPTION_KEYS = ('description', 'summary', 'subTitle', 'subtitle')
+DATE_KEYS = ('startDate', 'startAt', 'startDt', 'beginDate', 'eventStartDate', 'evntStartDt', 'date', 'openDate')
+END_DATE_KEYS = ('endDate', 'endAt', 'endDt', 'finishDate', 'eventEndDate', 'evntEndDt')
+LOCATION_KEYS = ('location', 'place', 'theater', 'theaterName', 'cinemaName', 'venue')
+IMAGE_KEYS = ('image', 'imageUrl', 'imgUrl', 'thumbnail', 'thumbnailUrl', 'posterUrl', 'bannerImage')
+LINK_KEYS = ('url', 'link', 'href', 'linkUrl', 'detailUrl')
+
+def _script_payloads(html):
+    """__NEXT_DATA__ / JSON-LD / application/json 스크립트 내용"""
+    for match in _SCRIPT_RE.finditer(html):
+        attrs = match.group(1).lower()
+        if '__next_data__' in attrs or 'application/ld+json' in attrs or 'application/json' in attrs:
+            try:
+                yield json.loads(match.group(2))
+            except ValueError:
+                continue
+
+
+def _inline_state_payloads(html):
+    """인라인 스크립트에 대입된 상태 객체 - 객체 끝은 JSON 디코더가 찾음"""
+    decoder = json.JSONDecoder()
+    for match in _INLINE_STATE_RE.finditer(html):
+        try:
+            payload, _ = decoder.raw_decode(html, match.end())
+        except ValueError:
+            continue
+        yield payload
+
+
+def extract_payloads(content):
+    """페이지에 포함된 구조화 데이터(JSON) 목록 - HTML 파싱 없이 원문에서 바로 찾음"""
+    html = content.decode('utf-8', errors='replace') if isinstance(content, bytes) else content
+    if '<script' not in html:
+        return []
+    return list(_script_payloads(html)) + list(_inline_state_payloads(html))
+
+
+def _first(record, keys):
+    for key in keys:
+        value = record.get(key)
+        if value not in (None, '', [], {}):
+            return value
+    return None
+
+
+def _text(value):
+    """JSON-LD의 중첩 객체({"name": ...})나 목록에서 문자열 값 꺼내기"""
+    if isinstance(value, list):
+        value = value[0] if value else None
+    if isinstance(value, dict):
+        value = _first(value, ('name', 'url', '@id', 'contentUrl'))
+        return _text(value) if isinstance(value, (dict, list)) else value
+    return value
+
+
+def normalize_date(value):
+    """날짜 문자열(기간이면 시작일)이나 epoch(초/밀리초)를 YYYY-MM-DD로 변환 - 알 수 없으면 None"""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        seconds = value / 1000 if value > 1e11 else value
+        try:
+            return datetime.fromtimestamp(seconds, tz=timezone.utc).strftime('%Y-%m-%d')
+        except (OverflowError, OSError, ValueError):
+            return None
+    if isinstance(value, str):
+        return parse_date_range(value).start
+    return None
+
+
+def _is_event_record(record):
+    """제목이 있고 링크나 날짜가 함께 있는 객체를 이벤트로 간주 (JSON-LD는 @type으로 판단)"""
+    record_type = record.get('@type')
+    if record_type:
+        types = record_type if isinstance(record_type, list) else [record_type]
+        if any(str(t).endswith('Event') for t in types):
+            return True
+    title = _first(record, TITLE_KEYS)
+    if not isinstance(title, str):
+        return False
+    return _first(record, LINK_KEYS) is not None or _first(record, DATE_KEYS) is not None
+
+
+def _walk(payload):
+    """중첩 JSON을 순회하며 이벤트로 보이는 객체를 순서대로 반환 (이벤트 객체 안쪽은 더 내려가지 않음)"""
+    stack = [payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if _is_event_record(node):
+                yield node
+                continue
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+
+
+def map_record(record, base_url):
+    """이벤트 객체를 크롤러 이벤트 필드로 변환 - 없는 값은 None"""
+    link = _text(_first(record, LINK_KEYS))
+    image = _text(_first(record, IMAGE_KEYS))
+    return {
+        'title': _text(_first(record, TITLE_KEYS)),
+        'description': _text(_first(record, DESCRIPTION_KEYS)),
+        'date': normalize_date(_first(record, DATE_KEYS)),
+        'end_date': normalize_date(_first(record, END_DATE_KEYS)),
+        'location': _text(_first(record, LOCATION_KEYS)),
+        'image': urljoin(base_url, image) if isinstance(image, str) else None,
+        'link': urljoin(base_url, link) if isinstance(link, str) else None
+    }
+
+
+def extract_structured_events(content, base_url):
+    """페이지에 포함된 JSON에서 이벤트 레코드 추출 - 없으면 빈 목록 (DOM 추출로 대체)"""
+    records = []
+    seen = set()
+    for payload in extract_payloads(content):
+        for record in _walk(payload):
+            mapped = map_record(record, base_url)
+            if not isinstance(mapped['title'], str):
+                continue
+            key = (mapped['title'], mapped['link'])
+            if key not in seen:
+                seen.add(key)
+                records.append(mapped)
+    return records
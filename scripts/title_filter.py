@@ -0,0 +1,93 @@
+import re
+from functools import lru_cache
+
+# 의미없는 제목 단어 - 제목에 포함되면 제외
+MEANINGLESS_WORDS = [
+    '더보기', '이전', '다음', '닫기', '보기', '이벤트', 'EVENT',
+    '사업자정보확인', '당첨자발표', '당첨자', '발표', '확인',
+    '공지사항', '안내', '알림', '정보', '관련', '문의',
+    '고객센터', '고객지원', '고객서비스', '고객안내',
+    '이용약관', '개인정보처리방침', '개인정보', '약관',
+    '로그인', '회원가입', '마이페이지', '예매', '예약',
+    '상영시간', '상영관', '영화관', '극장', '매장',
+    '홈', '메인', '메뉴', '검색', '찾기', '바로가기',
+    '새창', '팝업', '레이어', '모달', '다이얼로그',
+    '버튼', '링크', '클릭', '터치', '스와이프',
+    '로딩', '로드', '업로드', '다운로드', '업데이트',
+    '새로고침', '새로고침', '새로고침', '새로고침',
+    'copyright', 'all rights reserved', 'copyright',
+    '주식회사', '㈜', '(주)', '유한회사', '(유)',
+    'corporation', 'company', 'inc', 'ltd', 'co',
+    '서울', '부산', '대구', '인천', '광주', '대전', '울산',
+    '강남', '강북', '강서', '강동', '서초', '송파',
+    '마포', '영등포', '용산', '성동', '광진', '동대문',
+    '중랑', '성북', '강북', '도봉', '노원', '은평',
+    '양천', '구로', '금천', '동작', '관악', '서초',
+    '강남', '송파', '강동', '광주', '경기', '인천',
+    '부산', '대구', '울산', '대전', '세종', '충북',
+    '충남', '전북', '전남', '경북', '경남', '제주'
+]
+
+# 영화 관련 키워드
+MOVIE_KEYWORDS = [
+    '시사회', '프리미어', '개봉', '상영', '영화', '무비', 'movie',
+    '감독', '배우', '주연', '조연', '출연', '연출', '제작',
+    '스틸컷', '포스터', '예고편', '트레일러', '메이킹',
+    '인터뷰', '토크', '팬미팅', '사인회', '오프라인',
+    '굿즈', '기념품', '포토카드', '포토존', '체험',
+    '이벤트', '행사', '프로모션', '캠페인', '콘서트',
+    '페스티벌', '영화제', '어워드', '시상식', '수상',
+    '특별', '한정', '단독', '독점', '최초', '최고',
+    '블라인드', '미리보기', '시연', '체험관', '전시',
+    '갤러리', '박물관', '아카이브', '컬렉션', '전시회'
+]
+
+
+def _compile_words(words):
+    """단어 목록을 하나의 정규식으로 합침 - 소문자 기준, 긴 단어 우선"""
+    unique = sorted({word.lower() for word in words}, key=len, reverse=True)
+    return re.compile('|'.join(re.escape(word) for word in unique))
+
+
+# 모듈 로드 시 한 번만 컴파일해서 제목마다 한 번의 스캔으로 검사
+_MEANINGLESS_RE = _compile_words(MEANINGLESS_WORDS)
+_MOVIE_KEYWORD_RE = _compile_words(MOVIE_KEYWORDS)
+_STRIP_RE = re.compile(r'[^\w\s가-힣\[\]()<>]')
+_NUMERIC_RE = re.compile(r'^[\d\s\-\.]+$')
+_SYMBOLS_RE = re.compile(r'^[^\w가-힣]+$')
+
+
+@lru_cache(maxsize=8192)
+def clean_title(title):
+    """제목 정리 및 개선 - 강화된 필터링 (의미없는 제목이면 빈 문자열)"""
+    if not title:
+        return ""
+
+    # 불필요한 문자 제거
+    title = _STRIP_RE.sub('', title).strip()
+
+    # 너무 짧은 제목 필터링
+    if len(title) < 5:
+        return ""
+
+    # 의미없는 단어를 포함하면 제외 (정확히 일치하는 경우 포함)
+    if _MEANINGLESS_RE.search(title.lower()):
+        return ""
+
+    # 숫자만 있는 경우 제외
+    if _NUMERIC_RE.match(title):
+        return ""
+
+    # 특수문자만 있는 경우 제외
+    if _SYMBOLS_RE.match(title):
+        return ""
+
+    return title
+
+
+@lru_cache(maxsize=8192)
+def is_movie_related(title):
+    """영화 관련 이벤트인지 확인"""
+    if not title:
+        return False
+    return _MOVIE_KEYWORD_RE.search(title.lower()) is not None
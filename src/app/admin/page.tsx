@@ -9,6 +9,7 @@ interface Event {
   title: string
   description: string
   date: string
+  end_date?: string
   location: string
   type: string
   genre: string
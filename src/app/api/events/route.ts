@@ -1,4 +1,5 @@
 import { NextRequest, NextResponse } from 'next/server'
+import crypto from 'crypto'
 import fs from 'fs'
 import path from 'path'
 
@@ -7,6 +8,7 @@ interface Event {
   title: string
   description: string
   date: string
+  end_date?: string
   location: string
   type: string
   genre: string
@@ -16,6 +18,151 @@ interface Event {
   created_at: string
 }
 
+// 크롤러가 events.json과 함께 만드는 패싯 인덱스 (scripts/indexes.py)
+// generation은 인덱스를 만들 때의 events.json 내용 해시(SHA-256)
+interface FacetIndex {
+  generation: string | null
+  total: number
+  dateOrder: number[]
+  fields: Record<string, Record<string, number[]>>
+  counts: Record<string, Record<string, number>>
+}
+
+// 크롤러가 만드는 검색 역색인 (한글 bigram / 영문 단어 토큰 → 이벤트 위치 목록)
+interface SearchIndex {
+  generation: string | null
+  total: number
+  tokens: Record<string, number[]>
+}
+
+// 파싱한 JSON 파일을 모듈 수준에 보관 - 수정 시각(mtime)과 크기가 같으면 요청마다 다시 읽고 파싱하지 않음
+// 크롤러는 임시 파일 rename으로, POST는 덮어쓰기로 파일을 바꾸므로 둘 다 mtime이 달라져 다음 요청에서 다시 읽음
+// generation은 파일 내용의 SHA-256 (scripts/exporter.py의 file_digest와 같은 값)
+const jsonCache = new Map<string, { mtimeMs: number; size: number; value: unknown; generation: string }>()
+
+function readJsonCached<T>(filePath: string): { value: T; generation: string } | null {
+  const stat = fs.statSync(filePath, { throwIfNoEntry: false })
+  if (!stat) {
+    return null
+  }
+  const cached = jsonCache.get(filePath)
+  if (cached && cached.mtimeMs === stat.mtimeMs && cached.size === stat.size) {
+    return { value: cached.value as T, generation: cached.generation }
+  }
+  const content = fs.readFileSync(filePath)
+  const value: T = JSON.parse(content.toString('utf-8'))
+  const generation = crypto.createHash('sha256').update(content).digest('hex')
+  jsonCache.set(filePath, { mtimeMs: stat.mtimeMs, size: stat.size, value, generation })
+  return { value, generation }
+}
+
+function loadIndex<T extends { generation: string | null }>(fileName: string, generation: string): T | null {
+  try {
+    const index = readJsonCached<T>(path.join(process.cwd(), 'public', 'data', fileName))?.value
+    // 다른 events.json으로 만든 인덱스(저장 도중 실패, POST로 이벤트 추가 등)는 사용하지 않음
+    return index && index.generation === generation ? index : null
+  } catch {
+    return null
+  }
+}
+
+// JSON.parse로 만든 객체에서 posting list 읽기 - 상속된 키(constructor, __proto__ 등)는 없는 값으로 취급
+function ownPostings(table: Record<string, number[]> | undefined, key: string): number[] {
+  return table && Object.prototype.hasOwnProperty.call(table, key) ? table[key] : []
+}
+
+// 패싯 필터를 posting list 교집합으로 계산 - posting list가 날짜순이라 결과도 날짜순
+function filterByFacets(index: FacetIndex, filters: [string, string | null][]): number[] {
+  const postings: number[][] = []
+  for (const [field, value] of filters) {
+    if (value) {
+      postings.push(ownPostings(index.fields[field], value))
+    }
+  }
+  if (postings.length === 0) {
+    return index.dateOrder
+  }
+  postings.sort((a, b) => a.length - b.length)
+  const others = postings.slice(1).map(positions => new Set(positions))
+  return postings[0].filter(position => others.every(set => set.has(position)))
+}
+
+// scripts/indexes.py의 tokenize와 같은 규칙 - 한글은 글자 bigram, 영문/숫자는 단어
+const TOKEN_PATTERN = /[가-힣]+|[a-z0-9]+/g
+const HANGUL_PATTERN = /^[가-힣]/
+
+// 영문/숫자 토큰의 모든 접미사를 정렬한 표 - 검색어로 시작하는 접미사 구간이 곧 검색어를 포함하는 토큰
+// 인덱스 파일을 다시 읽기 전까지 한 번만 만들고, 인덱스 객체가 바뀌면 함께 버려짐
+interface LatinVocabulary {
+  suffixes: string[]
+  tokens: string[]
+}
+
+const latinVocabularies = new WeakMap<SearchIndex, LatinVocabulary>()
+
+function latinVocabulary(index: SearchIndex): LatinVocabulary {
+  let vocabulary = latinVocabularies.get(index)
+  if (!vocabulary) {
+    const entries: [string, string][] = []
+    for (const token of Object.keys(index.tokens)) {
+      if (!HANGUL_PATTERN.test(token)) {
+        for (let i = 0; i < token.length; i++) {
+          entries.push([token.slice(i), token])
+        }
+      }
+    }
+    entries.sort((a, b) => (a[0] < b[0] ? -1 : a[0] > b[0] ? 1 : 0))
+    vocabulary = { suffixes: entries.map(entry => entry[0]), tokens: entries.map(entry => entry[1]) }
+    latinVocabularies.set(index, vocabulary)
+  }
+  return vocabulary
+}
+
+// 검색어를 포함하는 영문/숫자 토큰 - 접미사 표에서 이진 탐색으로 구간의 시작을 찾음
+function tokensContaining(vocabulary: LatinVocabulary, run: string): Set<string> {
+  const { suffixes, tokens } = vocabulary
+  let low = 0
+  let high = suffixes.length
+  while (low < high) {
+    const mid = (low + high) >> 1
+    if (suffixes[mid] < run) {
+      low = mid + 1
+    } else {
+      high = mid
+    }
+  }
+  const found = new Set<string>()
+  for (let i = low; i < suffixes.length && suffixes[i].startsWith(run); i++) {
+    found.add(tokens[i])
+  }
+  return found
+}
+
+// 검색어를 포함할 수 있는 이벤트 위치 후보 - 토큰이 하나도 없으면 null (인덱스로 좁힐 수 없음)
+function searchCandidates(index: SearchIndex, search: string): Set<number> | null {
+  const postings: Set<number>[] = []
+  for (const run of search.toLowerCase().match(TOKEN_PATTERN) || []) {
+    if (HANGUL_PATTERN.test(run)) {
+      for (let i = 0; i < run.length - 1; i++) {
+        postings.push(new Set(ownPostings(index.tokens, run.slice(i, i + 2))))
+      }
+    } else {
+      // 영문은 단어 일부만 검색할 수 있으므로 검색어를 포함하는 모든 단어 토큰의 합집합
+      const union = new Set<number>()
+      for (const token of tokensContaining(latinVocabulary(index), run)) {
+        index.tokens[token].forEach(position => union.add(position))
+      }
+      postings.push(union)
+    }
+  }
+  if (postings.length === 0) {
+    return null
+  }
+  postings.sort((a, b) => a.size - b.size)
+  const [smallest, ...others] = postings
+  return new Set([...smallest].filter(position => others.every(set => set.has(position))))
+}
+
 export async function GET(request: NextRequest) {
   try {
     const { searchParams } = new URL(request.url)
@@ -26,10 +173,11 @@ export async function GET(request: NextRequest) {
     const page = parseInt(searchParams.get('page') || '1')
     const limit = parseInt(searchParams.get('limit') || '10')
     
-    // JSON 파일에서 이벤트 데이터 읽기
+    // JSON 파일에서 이벤트 데이터 읽기 (파일이 바뀌지 않았으면 캐시된 목록 사용 - 수정하지 말 것)
     const dataPath = path.join(process.cwd(), 'public', 'data', 'events.json')
+    const eventsFile = readJsonCached<Event[]>(dataPath)
     
-    if (!fs.existsSync(dataPath)) {
+    if (!eventsFile) {
       return NextResponse.json({ 
         events: [], 
         total: 0, 
@@ -39,8 +187,44 @@ export async function GET(request: NextRequest) {
       })
     }
     
-    const fileContent = fs.readFileSync(dataPath, 'utf-8')
-    let events: Event[] = JSON.parse(fileContent)
+    const { value: allEvents, generation } = eventsFile
+    const facetIndex = loadIndex<FacetIndex>('events-facets.json', generation)
+    let events: Event[]
+    
+    if (facetIndex) {
+      // 유형/장르/출처 필터링과 날짜순 정렬을 인덱스로 처리
+      let positions = filterByFacets(facetIndex, [['type', type], ['genre', genre], ['source', source]])
+      
+      // 검색어 후보를 역색인으로 좁힘 - 실제 포함 여부는 아래 검색 필터링에서 후보만 확인
+      const searchIndex = search ? loadIndex<SearchIndex>('events-search.json', generation) : null
+      const candidates = searchIndex && search ? searchCandidates(searchIndex, search) : null
+      if (candidates) {
+        positions = positions.filter(position => candidates.has(position))
+      }
+      
+      events = positions.map(position => allEvents[position])
+    } else {
+      // 캐시된 목록을 정렬로 바꾸지 않도록 복사본 사용
+      events = [...allEvents]
+      
+      // 유형 필터링
+      if (type) {
+        events = events.filter(event => event.type === type)
+      }
+      
+      // 장르 필터링
+      if (genre) {
+        events = events.filter(event => event.genre === genre)
+      }
+      
+      // 출처 필터링
+      if (source) {
+        events = events.filter(event => event.source === source)
+      }
+      
+      // 날짜순 정렬 (최신순)
+      events.sort((a, b) => new Date(b.date).getTime() - new Date(a.date).getTime())
+    }
     
     // 검색 필터링
     if (search) {
@@ -51,24 +235,6 @@ export async function GET(request: NextRequest) {
       )
     }
     
-    // 유형 필터링
-    if (type) {
-      events = events.filter(event => event.type === type)
-    }
-    
-    // 장르 필터링
-    if (genre) {
-      events = events.filter(event => event.genre === genre)
-    }
-    
-    // 출처 필터링
-    if (source) {
-      events = events.filter(event => event.source === source)
-    }
-    
-    // 날짜순 정렬 (최신순)
-    events.sort((a, b) => new Date(b.date).getTime() - new Date(a.date).getTime())
-    
     // 페이지네이션
     const total = events.length
     const totalPages = Math.ceil(total / limit)
@@ -82,7 +248,8 @@ export async function GET(request: NextRequest) {
       page,
       totalPages,
       hasNext: page < totalPages,
-      hasPrev: page > 1
+      hasPrev: page > 1,
+      ...(facetIndex && { facets: facetIndex.counts })
     })
     
   } catch (error) {
@@ -9,6 +9,7 @@ interface Event {
   title: string
   description: string
   date: string
+  end_date?: string
   location: string
   type: string
   genre: string
@@ -18,6 +19,21 @@ interface Event {
   created_at: string
 }
 
+// 크롤러가 만드는 날짜순 페이지 파일 목록 (events-manifest.json)
+interface EventManifestPage {
+  file: string
+  count: number
+  firstDate: string
+  lastDate: string
+  hash: string
+}
+
+interface EventManifest {
+  total: number
+  pageSize: number
+  pages: EventManifestPage[]
+}
+
 export default function HomePage() {
   const [events, setEvents] = useState<Event[]>([])
   const [loading, setLoading] = useState(true)
@@ -36,9 +52,31 @@ export default function HomePage() {
 
   const fetchEvents = async () => {
     try {
-      const response = await fetch('/data/events.json')
-      const data = await response.json()
-      setEvents(data)
+      const manifestResponse = await fetch('/data/events-manifest.json', { cache: 'no-cache' })
+      if (!manifestResponse.ok) {
+        // 페이지 파일이 없으면 전체 파일 사용
+        const response = await fetch('/data/events.json')
+        setEvents(await response.json())
+        return
+      }
+      
+      // 첫 페이지를 먼저 보여주고 나머지 페이지는 이어서 불러옴
+      // 해시를 쿼리에 붙여서 내용이 그대로인 페이지는 브라우저 캐시 사용
+      const manifest: EventManifest = await manifestResponse.json()
+      const fetchPage = async (page: EventManifestPage): Promise<Event[]> => {
+        const response = await fetch(`/data/${page.file}?v=${page.hash}`, { cache: 'force-cache' })
+        return response.json()
+      }
+      const [firstPage, ...restPages] = manifest.pages
+      if (!firstPage) {
+        setEvents([])
+        return
+      }
+      setEvents(await fetchPage(firstPage))
+      setLoading(false)
+      
+      const rest = await Promise.all(restPages.map(fetchPage))
+      setEvents(current => current.concat(...rest))
     } catch (error) {
       console.error('이벤트 데이터를 불러오는데 실패했습니다:', error)
     } finally {
@@ -269,6 +307,7 @@ export default function HomePage() {
                       <div className="flex items-center text-sm text-gray-300">
                         <Calendar className="h-4 w-4 mr-2 text-blue-400" />
                         {formatDate(event.date)}
+                        {event.end_date && ` ~ ${formatDate(event.end_date)}`}
                       </div>
                       <div className="flex items-center text-sm text-gray-300">
                         <MapPin className="h-4 w-4 mr-2 text-green-400" />